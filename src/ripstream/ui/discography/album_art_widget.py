@@ -8,8 +8,16 @@ from pathlib import Path
 from typing import Any
 
 import qtawesome as qta
-from PyQt6.QtCore import QSize, Qt, pyqtSignal
-from PyQt6.QtGui import QBrush, QColor, QMouseEvent, QPainter, QPainterPath, QPixmap
+from PyQt6.QtCore import QEvent, QSize, Qt, pyqtSignal
+from PyQt6.QtGui import (
+    QBrush,
+    QColor,
+    QMouseEvent,
+    QPainter,
+    QPainterPath,
+    QPixmap,
+    QPixmapCache,
+)
 from PyQt6.QtWidgets import (
     QLabel,
     QPushButton,
@@ -41,18 +49,27 @@ EXPLICIT_BUTTON_SIZE = 20
 EXPLICIT_BUTTON_CORNER_RADIUS = EXPLICIT_BUTTON_SIZE // 2
 EXPLICIT_BUTTON_Y_ADJUST = 6
 
+# Prefix for display-ready artwork stored in the global QPixmapCache
+ARTWORK_CACHE_PREFIX = "ripstream-album-art"
+
 
 class AlbumArtWidget(QWidget):
     """Widget for displaying album artwork like Plex."""
 
     clicked = pyqtSignal(str)  # item_id
     download_requested = pyqtSignal(dict)  # item_details
+    status_changed = pyqtSignal(str)  # new status
+
+    # Every tile has the same fixed size, so layouts never need to measure one
+    TILE_SIZE = QSize(CARD_WIDTH, CARD_HEIGHT)
 
     def __init__(self, item_data: dict[str, Any], parent=None):
         super().__init__(parent)
         self.item_data = item_data
         self.item_id = item_data.get("id", "")
         self.art_label = None
+        # Source pixmap of the current artwork, kept to rescale on DPR changes
+        self._source_pixmap: QPixmap | None = None
         # Track current status to avoid unintended resets. Values: "idle" | "queued" | "downloading" | "downloaded"
         self._status: str = "idle"
         # Keep a reference to any active icon animation to avoid garbage collection
@@ -61,7 +78,7 @@ class AlbumArtWidget(QWidget):
 
     def setup_ui(self):
         """Set up the album art widget."""
-        self.setFixedSize(CARD_WIDTH, CARD_HEIGHT)  # art + text and button
+        self.setFixedSize(self.TILE_SIZE)  # art + text and button
         self.setStyleSheet("""
             QWidget {
                 background-color: transparent;
@@ -245,6 +262,14 @@ class AlbumArtWidget(QWidget):
         layout.addWidget(art_container)
         layout.addWidget(text_container)
 
+    def sizeHint(self) -> QSize:  # noqa: N802
+        """Return the constant tile size."""
+        return self.TILE_SIZE
+
+    def minimumSizeHint(self) -> QSize:  # noqa: N802
+        """Return the constant tile size."""
+        return self.TILE_SIZE
+
     def load_artwork(self):
         """Load artwork or show placeholder with rounded corners."""
         # Try to load cached artwork from ~/.cache/ripstream based on artwork_url
@@ -266,6 +291,21 @@ class AlbumArtWidget(QWidget):
         title = self.item_data.get("title", "Unknown")
         first_letter = title[0].upper() if title else "?"
 
+        if self.art_label:
+            self.art_label.setPixmap(self._placeholder_pixmap(first_letter))
+
+    @staticmethod
+    def _placeholder_pixmap(first_letter: str) -> QPixmap:
+        """Return the placeholder artwork for ``first_letter``.
+
+        Placeholders only depend on the letter, so each one is painted once and
+        then served from ``QPixmapCache`` for every other tile.
+        """
+        cache_key = f"{ARTWORK_CACHE_PREFIX}:placeholder:{first_letter}"
+        cached = QPixmapCache.find(cache_key)
+        if cached is not None and not cached.isNull():
+            return cached
+
         pixmap = QPixmap(ART_SIZE, ART_SIZE)
         pixmap.fill(Qt.GlobalColor.transparent)
 
@@ -292,8 +332,8 @@ class AlbumArtWidget(QWidget):
 
         painter.end()
 
-        if self.art_label:
-            self.art_label.setPixmap(pixmap)
+        QPixmapCache.insert(cache_key, pixmap)
+        return pixmap
 
     def _create_rounded_pixmap(self, width: int, height: int, radius: int) -> QPixmap:
         """Create a pixmap with rounded corners."""
@@ -316,19 +356,35 @@ class AlbumArtWidget(QWidget):
     def update_artwork(self, pixmap: QPixmap):
         """Update the artwork with a new pixmap and apply rounded corners."""
         if self.art_label and pixmap and not pixmap.isNull():
-            # Scale pixmap to fit the label
-            scaled_pixmap = pixmap.scaled(
-                ART_SIZE,
-                ART_SIZE,
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation,
-            )
+            self._source_pixmap = pixmap
+            self.art_label.setPixmap(self._prepare_artwork(pixmap))
 
-            # Apply rounded corners to the scaled pixmap
-            rounded_pixmap = self._apply_rounded_corners(
-                scaled_pixmap, ART_CORNER_RADIUS
-            )
-            self.art_label.setPixmap(rounded_pixmap)
+    def _prepare_artwork(self, pixmap: QPixmap) -> QPixmap:
+        """Return a display-ready copy of ``pixmap`` for the current screen.
+
+        The pixmap is scaled to the art size in device pixels and rounded once;
+        the result is cached in ``QPixmapCache`` so the same artwork shown by
+        several tiles (or re-added after a refresh) is never scaled again.
+        """
+        dpr = self.devicePixelRatioF()
+        cache_key = f"{ARTWORK_CACHE_PREFIX}:{pixmap.cacheKey()}:{dpr}"
+        cached = QPixmapCache.find(cache_key)
+        if cached is not None and not cached.isNull():
+            return cached
+
+        target = round(ART_SIZE * dpr)
+        scaled_pixmap = pixmap.scaled(
+            target,
+            target,
+            Qt.AspectRatioMode.KeepAspectRatio,
+            Qt.TransformationMode.SmoothTransformation,
+        )
+        rounded_pixmap = self._apply_rounded_corners(
+            scaled_pixmap, round(ART_CORNER_RADIUS * dpr)
+        )
+        rounded_pixmap.setDevicePixelRatio(dpr)
+        QPixmapCache.insert(cache_key, rounded_pixmap)
+        return rounded_pixmap
 
     def _apply_rounded_corners(self, pixmap: QPixmap, radius: int) -> QPixmap:
         """Apply rounded corners to a pixmap."""
@@ -339,13 +395,11 @@ class AlbumArtWidget(QWidget):
         painter = QPainter(rounded_pixmap)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
-        # Create rounded rectangle path
-        path = QPainterPath()
-        path.addRoundedRect(0, 0, size.width(), size.height(), radius, radius)
-
-        # Set clipping path and draw the original pixmap
-        painter.setClipPath(path)
-        painter.drawPixmap(0, 0, pixmap)
+        # Fill the rounded rectangle with the pixmap as a texture: a single
+        # antialiased draw instead of setting a clip path and blitting
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(QBrush(pixmap))
+        painter.drawRoundedRect(0, 0, size.width(), size.height(), radius, radius)
 
         painter.end()
         return rounded_pixmap
@@ -377,7 +431,7 @@ class AlbumArtWidget(QWidget):
         )
         self.download_btn.setEnabled(False)
         self.download_btn.setToolTip("Queued for download")
-        self._status = "queued"
+        self._set_status("queued")
 
     def set_downloading_status(self):
         """Update the button to show downloading (work in progress) status."""
@@ -405,7 +459,7 @@ class AlbumArtWidget(QWidget):
         )
         self.download_btn.setEnabled(False)
         self.download_btn.setToolTip("Downloading...")
-        self._status = "downloading"
+        self._set_status("downloading")
 
     def set_downloaded_status(self, is_downloaded: bool):
         """Update the download button to show downloaded status."""
@@ -430,7 +484,7 @@ class AlbumArtWidget(QWidget):
             self.download_btn.clicked.disconnect()
             self.download_btn.clicked.connect(lambda: None)  # No action
             self.download_btn.setToolTip("Already downloaded")
-            self._status = "downloaded"
+            self._set_status("downloaded")
         else:
             # Do not reset here; keep current status (queued/downloading/idle)
             return
@@ -463,7 +517,7 @@ class AlbumArtWidget(QWidget):
         self.download_btn.clicked.connect(self._on_download_clicked)
         self.download_btn.setEnabled(True)
         self.download_btn.setToolTip("Download")
-        self._status = "idle"
+        self._set_status("idle")
 
     def update_download_status_from_albums(self, downloaded_albums: set):
         """Update download status based on downloaded albums set.
@@ -484,6 +538,23 @@ class AlbumArtWidget(QWidget):
         """Get current button status."""
         return self._status
 
+    def _set_status(self, status: str) -> None:
+        """Record the button status and announce it when it changes."""
+        if status != self._status:
+            self._status = status
+            self.status_changed.emit(status)
+
+    def changeEvent(self, a0: QEvent | None):  # noqa: N802
+        """Rescale the artwork when the widget moves to a screen with another DPR."""
+        super().changeEvent(a0)
+        if (
+            a0
+            and a0.type() == QEvent.Type.DevicePixelRatioChange
+            and self._source_pixmap is not None
+            and self.art_label
+        ):
+            self.art_label.setPixmap(self._prepare_artwork(self._source_pixmap))
+
     def mousePressEvent(self, a0: QMouseEvent | None):  # noqa: N802
         """Handle mouse press events."""
         if a0 and a0.button() == Qt.MouseButton.LeftButton:
@@ -3,6 +3,7 @@
 
 """Grid view for displaying album artwork."""
 
+import functools
 from typing import Any
 
 from PyQt6.QtCore import Qt, pyqtSignal
@@ -12,6 +13,34 @@ from PyQt6.QtWidgets import QGridLayout, QLabel, QScrollArea, QVBoxLayout, QWidg
 from ripstream.ui.discography.album_art_widget import AlbumArtWidget
 
 
+def _normalize_text(value: Any) -> str:
+    if value is None:
+        return ""
+    return str(value).lower()
+
+
+def _normalize_year(value: Any) -> int:
+    try:
+        # Some sources provide year as str or may be empty/"-"
+        if value in (None, "", "-"):
+            return 0
+        return int(value)
+    except (ValueError, TypeError):
+        return 0
+
+
+# Horizontal space per grid column: tile width plus spacing/margins
+GRID_CELL_WIDTH = AlbumArtWidget.TILE_SIZE.width() + 20
+
+# (primary, secondary) sort columns per supported sort field; unknown fields
+# fall back to title
+_SORT_COLUMNS = {
+    "title": ("title", "artist"),
+    "artist": ("artist", "title"),
+    "year": ("year", "title"),
+}
+
+
 class AlbumArtGridView(QScrollArea):
     """Grid view for displaying album artwork."""
 
@@ -25,6 +54,20 @@ class AlbumArtGridView(QScrollArea):
         self.count_label = QLabel("0 Albums")
         self._current_downloaded_albums = set()  # Initialize empty set
         self._filter_text: str = ""
+        # Column count the tiles are currently placed with (0 = nothing placed)
+        self._layout_columns: int = 0
+        # Tiles per album id, for O(1) artwork, status and membership lookups
+        self._items_by_id: dict[str, list[AlbumArtWidget]] = {}
+        # Tiles currently shown as queued or downloading, kept current by
+        # each tile's status_changed signal
+        self._active_items: set[AlbumArtWidget] = set()
+        # Normalized sort/filter values stored column-wise (one dict per field,
+        # keyed by tile) and computed once when a tile is added
+        self._columns: dict[str, dict[Any, Any]] = {
+            "title": {},
+            "artist": {},
+            "year": {},
+        }
         self.setup_ui()
 
     def setup_ui(self):
@@ -53,33 +96,57 @@ class AlbumArtGridView(QScrollArea):
         """)
         main_layout.addWidget(self.count_label)
 
-        # Grid container
-        grid_container = QWidget()
-        self.grid_layout = QGridLayout(grid_container)
-        self.grid_layout.setSpacing(16)
-        self.grid_layout.setAlignment(
-            Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignLeft
-        )
+        # Grid container; every tile is parented to it so clearing is one delete
+        self._tiles_host, self.grid_layout = self._create_tiles_host()
 
-        main_layout.addWidget(grid_container)
+        main_layout.addWidget(self._tiles_host)
         main_layout.addStretch()  # Add stretch to push content to top
         self.setWidget(self.container)
 
+    def _create_tiles_host(self) -> tuple[QWidget, QGridLayout]:
+        """Create the widget hosting the tiles together with its grid layout."""
+        tiles_host = QWidget()
+        grid_layout = QGridLayout(tiles_host)
+        grid_layout.setSpacing(16)
+        grid_layout.setAlignment(Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignLeft)
+        return tiles_host, grid_layout
+
     def add_item(self, item_data: dict[str, Any], parent_pending_artwork=None):
         """Add an item to the grid."""
         item_id = item_data.get("id", "")
 
         art_widget = AlbumArtWidget(item_data)
-        art_widget.clicked.connect(self.item_selected.emit)
-        art_widget.download_requested.connect(self.download_requested.emit)
+        # Chain tile signals straight to ours: Qt forwards them in C++ without
+        # calling back into a Python slot per emission
+        art_widget.clicked.connect(
+            self.item_selected, Qt.ConnectionType.DirectConnection
+        )
+        art_widget.download_requested.connect(
+            self.download_requested, Qt.ConnectionType.DirectConnection
+        )
 
-        # Calculate grid position
-        items_per_row = max(1, self.width() // 200)  # 180 + 20 margin
-        row = len(self.items) // items_per_row
-        col = len(self.items) % items_per_row
+        art_widget.status_changed.connect(
+            functools.partial(self._on_item_status_changed, art_widget)
+        )
+
+        # Id-less tiles stay unindexed so they can never collide
+        if item_id:
+            self._items_by_id.setdefault(item_id, []).append(art_widget)
 
-        self.grid_layout.addWidget(art_widget, row, col)
-        self.items.append(art_widget)
+        # Calculate grid position
+        items_per_row = self._columns_for_width()
+        if self.items and items_per_row != self._layout_columns:
+            # Width changed since the last placement; re-flow every tile
+            self.items.append(art_widget)
+            self._index_columns(art_widget)
+            self.update_grid_layout(force=True)
+        else:
+            row = len(self.items) // items_per_row
+            col = len(self.items) % items_per_row
+            self.grid_layout.addWidget(art_widget, row, col)
+            self.items.append(art_widget)
+            self._index_columns(art_widget)
+            self._layout_columns = items_per_row
 
         # Update count
         self.update_count()
@@ -106,66 +173,68 @@ class AlbumArtGridView(QScrollArea):
         if not self.items:
             return
 
-        def normalize_text(value: Any) -> str:
-            if value is None:
-                return ""
-            return str(value).lower()
-
-        def normalize_year(value: Any) -> int:
-            try:
-                # Some sources provide year as str or may be empty/"-"
-                if value in (None, "", "-"):
-                    return 0
-                return int(value)
-            except (ValueError, TypeError):
-                return 0
-
-        def item_key(widget: AlbumArtWidget):  # type: ignore[name-defined]
-            data = getattr(widget, "item_data", {}) or {}
-            if sort_by == "artist":
-                return (
-                    normalize_text(data.get("artist", "")),
-                    normalize_text(data.get("title", "")),
-                )
-            if sort_by == "year":
-                return (
-                    normalize_year(data.get("year")),
-                    normalize_text(data.get("title", "")),
-                )
-            # Default to title
-            return (
-                normalize_text(data.get("title", "")),
-                normalize_text(data.get("artist", "")),
-            )
+        primary_name, secondary_name = _SORT_COLUMNS.get(
+            sort_by, _SORT_COLUMNS["title"]
+        )
+        for widget in self.items:
+            if widget not in self._columns["title"]:
+                self._index_columns(widget)
+        primary = self._columns[primary_name]
+        secondary = self._columns[secondary_name]
+        ordered = sorted(
+            self.items,
+            key=lambda widget: (primary[widget], secondary[widget]),
+            reverse=descending,
+        )
+        # The parent view re-sorts after every insert; skip the re-flow when
+        # the order is already correct
+        if all(new is old for new, old in zip(ordered, self.items, strict=True)):
+            return
 
         # Reorder widgets and refresh positions
-        self.items.sort(key=item_key, reverse=descending)
-        self.update_grid_layout()
+        self.items[:] = ordered
+        self.update_grid_layout(force=True)
+
+    def _index_columns(self, widget: AlbumArtWidget) -> None:
+        """Store the normalized sort/filter values of ``widget``."""
+        data = getattr(widget, "item_data", {}) or {}
+        self._columns["title"][widget] = _normalize_text(data.get("title", ""))
+        self._columns["artist"][widget] = _normalize_text(data.get("artist", ""))
+        self._columns["year"][widget] = _normalize_year(data.get("year"))
+
+    def has_item(self, item_id: str) -> bool:
+        """Return True if a tile for ``item_id`` is in the grid."""
+        return item_id in self._items_by_id
 
     def update_item_artwork(self, item_id: str, pixmap: QPixmap):
         """Update artwork for a specific item."""
-        # Try to find and update the item immediately
-        for item in self.items:
-            if hasattr(item, "item_id") and item.item_id == item_id:
-                item.update_artwork(pixmap)
-                return
-
-        # If item not found, the parent DiscographyView will handle pending artwork
-        # No-op if not found; parent will handle
+        items = self._items_by_id.get(item_id)
+        if not items:
+            # Not added yet; the parent DiscographyView keeps it as pending artwork
+            return
+        items[0].update_artwork(pixmap)
 
     def clear_items(self):
-        """Clear all items from the grid."""
-        for item in self.items:
-            item.deleteLater()
+        """Clear all items from the grid.
+
+        The tiles are children of the tiles host, so swapping in a fresh host
+        and deleting the old one frees them all with a single deferred delete.
+        """
+        if self.items:
+            old_host = self._tiles_host
+            self._tiles_host, self.grid_layout = self._create_tiles_host()
+            main_layout = self.container.layout()
+            if main_layout is not None:
+                main_layout.replaceWidget(old_host, self._tiles_host)
+            old_host.hide()
+            old_host.deleteLater()
         self.items.clear()
+        self._items_by_id.clear()
+        self._active_items.clear()
+        for column in self._columns.values():
+            column.clear()
 
-        # Clear layout
-        while self.grid_layout.count():
-            child = self.grid_layout.takeAt(0)
-            if child and child.widget():
-                widget = child.widget()
-                if widget:
-                    widget.deleteLater()
+        self._layout_columns = 0
 
         # Update count
         self.update_count()
@@ -175,12 +244,22 @@ class AlbumArtGridView(QScrollArea):
         super().resizeEvent(a0)
         self.update_grid_layout()
 
-    def update_grid_layout(self):
-        """Update the grid layout based on current width."""
+    def _columns_for_width(self) -> int:
+        """Return how many tiles fit in one row at the current width."""
+        return max(1, self.width() // GRID_CELL_WIDTH)
+
+    def update_grid_layout(self, force: bool = False):
+        """Update the grid layout based on current width.
+
+        Resizes that keep the same column count leave the placement untouched;
+        pass ``force`` after changing the order or visibility of the tiles.
+        """
         if not self.items:
             return
 
-        items_per_row = max(1, self.width() // 200)
+        items_per_row = self._columns_for_width()
+        if not force and items_per_row == self._layout_columns:
+            return
 
         # Remove all current widget placements
         while self.grid_layout.count():
@@ -197,6 +276,7 @@ class AlbumArtGridView(QScrollArea):
             row = i // items_per_row
             col = i % items_per_row
             self.grid_layout.addWidget(item, row, col)
+        self._layout_columns = items_per_row
 
     def update_count(self):
         """Update the count label."""
@@ -227,20 +307,38 @@ class AlbumArtGridView(QScrollArea):
     def update_active_statuses(
         self, downloading_album_ids: set[str], pending_album_ids: set[str]
     ) -> None:
-        """Update active statuses (downloading/pending) for all items."""
-        for item in self.items:
-            if not isinstance(item, AlbumArtWidget):
-                continue
-            album_id = getattr(item, "item_id", "")
-            if not album_id:
+        """Update active statuses (downloading/pending) of the affected tiles.
+
+        Only tiles named in either set, or currently shown as queued or
+        downloading, are visited, so the cost follows the download queue
+        rather than the grid. Downloaded tiles are never overridden, and tiles
+        already in their target state are left alone.
+        """
+        touched = dict.fromkeys(self._active_items)
+        for album_id in downloading_album_ids | pending_album_ids:
+            touched.update(dict.fromkeys(self._items_by_id.get(album_id, ())))
+
+        for item in touched:
+            album_id = item.item_id
+            status = item.get_status()
+            if status == "downloaded":
                 continue
             if album_id in downloading_album_ids:
-                item.set_downloading_status()
-            elif album_id in pending_album_ids and item.get_status() != "downloaded":
-                item.set_queued_status()
-            elif item.get_status() in {"queued", "downloading"}:
+                if status != "downloading":
+                    item.set_downloading_status()
+            elif album_id in pending_album_ids:
+                if status != "queued":
+                    item.set_queued_status()
+            elif status in {"queued", "downloading"}:
                 item.set_idle_status()
 
+    def _on_item_status_changed(self, item: AlbumArtWidget, status: str) -> None:
+        """Keep the set of queued/downloading tiles in step with ``item``."""
+        if status in {"queued", "downloading"}:
+            self._active_items.add(item)
+        else:
+            self._active_items.discard(item)
+
     def set_filter(self, query_text: str) -> None:
         """Filter items by album title.
 
@@ -256,13 +354,15 @@ class AlbumArtGridView(QScrollArea):
         else:
             for w in self.items:
                 w.setVisible(self._matches_filter(w))
-        self.update_grid_layout()
+        self.update_grid_layout(force=True)
         self.update_count()
 
     def _matches_filter(self, widget: AlbumArtWidget) -> bool:  # type: ignore[name-defined]
         """Return True if the widget matches the current filter text."""
         if not self._filter_text:
             return True
-        data = getattr(widget, "item_data", {}) or {}
-        title = str(data.get("title", "")).lower()
+        title = self._columns["title"].get(widget)
+        if title is None:
+            data = getattr(widget, "item_data", {}) or {}
+            title = _normalize_text(data.get("title", ""))
         return self._filter_text in title
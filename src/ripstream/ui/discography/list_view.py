@@ -3,20 +3,82 @@
 
 """List view for displaying discography items."""
 
+import bisect
+import functools
+import sys
+from collections.abc import Iterable
 from typing import Any, ClassVar
 
 import qtawesome as qta
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import (
+    QAbstractItemModel,
+    QAbstractTableModel,
+    QModelIndex,
+    QPersistentModelIndex,
+    Qt,
+    QTimer,
+    pyqtSignal,
+)
+from PyQt6.QtGui import QAction
 from PyQt6.QtWidgets import (
     QAbstractItemView,
     QHBoxLayout,
     QHeaderView,
+    QMenu,
     QPushButton,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QWidget,
 )
 
+LIST_HEADERS = (
+    "Title",
+    "Artist",
+    "Album",
+    "Year",
+    "Duration",
+    "Tracks",
+    "Quality",
+    "Actions",
+)
+ACTIONS_COLUMN = 7
+
+# Item field rendered into each data column, in column order
+ROW_FIELDS = (
+    "title",
+    "artist",
+    "type",
+    "year",
+    "duration_formatted",
+    "track_count",
+    "quality",
+)
+# Sort keys accepted by DiscographyListView.sort_items
+SORT_COLUMNS = {"title": 0, "artist": 1, "year": 3}
+# Representative text used to size each column once, instead of measuring rows
+COLUMN_WIDTH_SAMPLES = (
+    "",
+    "Unknown Artist",
+    "Album Name Truncated...",
+    "9999",
+    "999:99",
+    "Track 99",
+    "24-bit/≥96kHz FLAC",
+)
+COLUMN_PADDING = 24
+ACTIONS_COLUMN_WIDTH = 100
+# Rows above and below the viewport that keep their Actions widgets
+ACTIONS_ROW_MARGIN = 10
+# Album names longer than this are shortened in the Album column of track rows
+ALBUM_NAME_LIMIT = 22
+
+# Roles exposed on the title column: the item id and the complete item data
+ITEM_ID_ROLE = Qt.ItemDataRole.UserRole
+ITEM_DATA_ROLE = Qt.ItemDataRole.UserRole + 1
+# Sorting only reorders rows, which lets views keep their column state
+SORT_LAYOUT_HINT = QAbstractItemModel.LayoutChangeHint.VerticalSortHint
+# Rows are selectable but never editable
+ITEM_FLAGS = Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEnabled
+
 
 class QualityMapper:
     """Generic quality mapping system for different streaming services."""
@@ -80,7 +142,268 @@ class QualityMapper:
         return str(quality_value)
 
 
-class DiscographyListView(QTableWidget):
+@functools.lru_cache(maxsize=1024)
+def _truncate_album(name: str, limit: int = ALBUM_NAME_LIMIT) -> str:
+    """Shorten an album name to ``limit`` characters plus an ellipsis.
+
+    Every track of an album carries the same name, so results are memoized.
+    """
+    return name if len(name) <= limit + 3 else name[:limit] + "..."
+
+
+def _format_row(item_data: dict[str, Any], service: str | None) -> tuple[str, ...]:
+    """Render the text of every data column for one item."""
+    # Title (without track number prefix)
+    title = str(item_data.get("title", "Unknown"))
+
+    # Artist
+    artist = item_data.get("artist", "")
+    if not artist:
+        artist = "Unknown"
+
+    # Type (show album name for tracks, truncated if too long)
+    item_type = item_data.get("type", "Album")
+    if item_type == "Track" and "album" in item_data:
+        type_display = _truncate_album(item_data["album"])
+    else:
+        type_display = item_type
+
+    # Year
+    year = item_data.get("year", "")
+    year_display = str(year) if year else "-"
+
+    # Duration
+    duration = item_data.get("duration_formatted", "")
+    duration_display = duration or "-"
+
+    # Tracks (show track number for individual tracks)
+    track_number = item_data.get("track_number")
+    if item_type == "Track" and track_number:
+        tracks_display = f"Track {track_number}"
+    else:
+        track_count = item_data.get("track_count", 0)
+        tracks_display = str(track_count) if track_count else "-"
+
+    # Quality (mapped to human-readable description)
+    quality = item_data.get("quality", "")
+    service_ = item_data.get("service", service)
+    quality_description = QualityMapper.get_quality_description(service_, quality)
+
+    # Artist, album, year and quality repeat across a discography's tracks;
+    # interning keeps one string per distinct value in the model columns
+    return (
+        title,
+        sys.intern(str(artist)),
+        sys.intern(str(type_display)),
+        sys.intern(year_display),
+        str(duration_display),
+        tracks_display,
+        sys.intern(quality_description),
+    )
+
+
+def _insertion_row(keys: list[str], key: str, descending: bool) -> int:
+    """Return the row after any equal keys at which ``key`` keeps ``keys`` sorted."""
+    if not descending:
+        return bisect.bisect_right(keys, key)
+    low, high = 0, len(keys)
+    while low < high:
+        mid = (low + high) // 2
+        if keys[mid] < key:
+            high = mid
+        else:
+            low = mid + 1
+    return low
+
+
+class DiscographyTableModel(QAbstractTableModel):
+    """Table model holding the rows shown by DiscographyListView.
+
+    Cell text is rendered once when a row is added and stored column-wise,
+    so sorting reads one contiguous list of keys; the view only asks for
+    the rows that are actually painted.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._items: list[dict[str, Any]] = []
+        # Item ids kept parallel to _items for lookups on selection/double-click
+        self._ids: list[str | None] = []
+        # One list of rendered text per data column (ROW_FIELDS order)
+        self._columns: list[list[str]] = [[] for _ in ROW_FIELDS]
+        # Column and order of the last sort; new rows are inserted in place
+        self._sort_column: int | None = None
+        self._sort_order = Qt.SortOrder.AscendingOrder
+
+    def rowCount(self, parent: QModelIndex | None = None) -> int:  # noqa: N802
+        """Return the number of rows."""
+        if parent is not None and parent.isValid():
+            return 0
+        return len(self._items)
+
+    def columnCount(self, parent: QModelIndex | None = None) -> int:  # noqa: N802
+        """Return the number of columns."""
+        if parent is not None and parent.isValid():
+            return 0
+        return len(LIST_HEADERS)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        """Return cell text, or the item id/data on the title column."""
+        if not index.isValid():
+            return None
+        row, column = index.row(), index.column()
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._columns[column][row] if column < len(self._columns) else None
+        if column == 0:
+            if role == ITEM_ID_ROLE:
+                return self._ids[row]
+            if role == ITEM_DATA_ROLE:
+                return self._items[row]
+        return None
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        """Return the read-only flags shared by every cell."""
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        return ITEM_FLAGS
+
+    def headerData(  # noqa: N802
+        self,
+        section: int,
+        orientation: Qt.Orientation,
+        role: int = Qt.ItemDataRole.DisplayRole,
+    ) -> Any:
+        """Return the column titles; rows keep Qt's default numbering."""
+        if (
+            orientation == Qt.Orientation.Horizontal
+            and role == Qt.ItemDataRole.DisplayRole
+            and 0 <= section < len(LIST_HEADERS)
+        ):
+            return LIST_HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def append_items(self, rows: list[tuple[dict[str, Any], tuple[str, ...]]]) -> range:
+        """Append ``(item_data, display)`` rows in one insertion and return their rows."""
+        first = len(self._items)
+        if not rows:
+            return range(first, first)
+        last = first + len(rows) - 1
+        self.beginInsertRows(QModelIndex(), first, last)
+        for item_data, display in rows:
+            self._items.append(item_data)
+            self._ids.append(item_data.get("id"))
+            for values, text in zip(self._columns, display, strict=True):
+                values.append(text)
+        self.endInsertRows()
+        return range(first, last + 1)
+
+    def add_items(self, rows: list[tuple[dict[str, Any], tuple[str, ...]]]) -> None:
+        """Add ``(item_data, display)`` rows, keeping the current sort order."""
+        if self._sort_column is None:
+            self.append_items(rows)
+        else:
+            self._insert_sorted(rows, self._sort_column)
+
+    def _insert_sorted(
+        self, rows: list[tuple[dict[str, Any], tuple[str, ...]]], column: int
+    ) -> None:
+        """Insert rows at their sorted positions, one insertion per contiguous run."""
+        keys = self._columns[column]
+        descending = self._sort_order == Qt.SortOrder.DescendingOrder
+        # Rows landing between the same two existing rows form one run
+        runs: list[tuple[int, list[tuple[dict[str, Any], tuple[str, ...]]]]] = []
+        for row in sorted(rows, key=lambda row: row[1][column], reverse=descending):
+            position = _insertion_row(keys, row[1][column], descending)
+            if runs and runs[-1][0] == position:
+                runs[-1][1].append(row)
+            else:
+                runs.append((position, [row]))
+
+        # Insert bottom-up so the positions of earlier runs stay valid
+        for position, run in reversed(runs):
+            self.beginInsertRows(QModelIndex(), position, position + len(run) - 1)
+            self._items[position:position] = [item_data for item_data, _ in run]
+            self._ids[position:position] = [item_data.get("id") for item_data, _ in run]
+            for index, values in enumerate(self._columns):
+                values[position:position] = [display[index] for _, display in run]
+            self.endInsertRows()
+
+    def clear(self) -> None:
+        """Remove every row."""
+        self.beginResetModel()
+        self._items.clear()
+        self._ids.clear()
+        for values in self._columns:
+            values.clear()
+        self.endResetModel()
+
+    def item_data(self, row: int) -> dict[str, Any]:
+        """Return the item data stored for ``row``."""
+        return self._items[row]
+
+    def row_id(self, row: int) -> str | None:
+        """Return the item id stored for ``row``."""
+        return self._ids[row]
+
+    def items(self) -> list[dict[str, Any]]:
+        """Return the item data of every row, in row order."""
+        return list(self._items)
+
+    def display_row(self, row: int) -> tuple[str, ...]:
+        """Return the rendered cell text of ``row``."""
+        return tuple(values[row] for values in self._columns)
+
+    def row_payload(self, row: int) -> dict[str, Any]:
+        """Return ``row`` as the field -> rendered text dict used for downloads."""
+        payload: dict[str, Any] = {"id": self._ids[row]}
+        payload.update(
+            zip(ROW_FIELDS, (values[row] for values in self._columns), strict=True)
+        )
+        return payload
+
+    def sort(
+        self, column: int, order: Qt.SortOrder = Qt.SortOrder.AscendingOrder
+    ) -> None:
+        """Stable-sort rows by the text of ``column``."""
+        if not 0 <= column < len(self._columns):
+            self._sort_column = None
+            return
+        self._sort_column = column
+        self._sort_order = order
+        if not self._items:
+            return
+        keys = self._columns[column]
+        permutation = sorted(
+            range(len(keys)),
+            key=keys.__getitem__,
+            reverse=order == Qt.SortOrder.DescendingOrder,
+        )
+        # Rows are inserted in sort order, so a repeated sort is usually a no-op
+        if all(old == new for new, old in enumerate(permutation)):
+            return
+
+        self.layoutAboutToBeChanged.emit([], SORT_LAYOUT_HINT)
+        self._items = [self._items[row] for row in permutation]
+        self._ids = [self._ids[row] for row in permutation]
+        self._columns = [
+            [values[row] for row in permutation] for values in self._columns
+        ]
+        # Keep persistent indexes (selection, action widgets) on their rows
+        new_rows = [0] * len(permutation)
+        for new, old in enumerate(permutation):
+            new_rows[old] = new
+        old_indexes = self.persistentIndexList()
+        self.changePersistentIndexList(
+            old_indexes,
+            [
+                self.index(new_rows[index.row()], index.column())
+                for index in old_indexes
+            ],
+        )
+        self.layoutChanged.emit([], SORT_LAYOUT_HINT)
+
+
+class DiscographyListView(QTableView):
     """List view for displaying discography items."""
 
     item_selected = pyqtSignal(str)  # item_id
@@ -91,145 +414,183 @@ class DiscographyListView(QTableWidget):
         super().__init__(parent)
         self._current_downloaded_albums = set()  # Initialize empty set
         self._filter_text: str = ""
+        self.table_model = DiscographyTableModel(self)
+        self.setModel(self.table_model)
+        # Actions cells that currently hold a widget; only rows near the
+        # viewport get one, so widget count does not grow with the list
+        self._action_indexes: list[QPersistentModelIndex] = []
+        # Bursts of selection changes are reported once per event-loop turn
+        self._selection_timer = QTimer(self)
+        self._selection_timer.setSingleShot(True)
+        self._selection_timer.setInterval(0)
+        self._selection_timer.timeout.connect(self._emit_selection)
         self.setup_ui()
 
     def setup_ui(self):
         """Set up the list view."""
-        # Set up columns
-        headers = [
-            "Title",
-            "Artist",
-            "Album",
-            "Year",
-            "Duration",
-            "Tracks",
-            "Quality",
-            "Actions",
-        ]
-        self.setColumnCount(len(headers))
-        self.setHorizontalHeaderLabels(headers)
-
         # Configure table
         self.setAlternatingRowColors(True)
         self.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        # No sort arrow until the user (or sort_items) picks a column
+        header = self.horizontalHeader()
+        if header is not None:
+            header.setSortIndicator(-1, Qt.SortOrder.AscendingOrder)
         self.setSortingEnabled(True)
 
         # Disable editing for all items
         self.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
 
-        # Configure column widths
-        header = self.horizontalHeader()
+        # Configure column widths: the title stretches, the rest get fixed
+        # widths up front so inserts and sorts never measure cell text
         if header is not None:
             header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)  # Title
-            header.setSectionResizeMode(
-                1, QHeaderView.ResizeMode.ResizeToContents
-            )  # Artist
-            header.setSectionResizeMode(
-                2, QHeaderView.ResizeMode.ResizeToContents
-            )  # Type
-            header.setSectionResizeMode(
-                3, QHeaderView.ResizeMode.ResizeToContents
-            )  # Year
-            header.setSectionResizeMode(
-                4, QHeaderView.ResizeMode.ResizeToContents
-            )  # Duration
-            header.setSectionResizeMode(
-                5, QHeaderView.ResizeMode.ResizeToContents
-            )  # Tracks
-            header.setSectionResizeMode(
-                6, QHeaderView.ResizeMode.ResizeToContents
-            )  # Quality
-            header.setSectionResizeMode(
-                7, QHeaderView.ResizeMode.ResizeToContents
-            )  # Actions
+            for column in range(1, len(LIST_HEADERS)):
+                header.setSectionResizeMode(column, QHeaderView.ResizeMode.Interactive)
+                self.setColumnWidth(column, self._default_column_width(column))
+
+        # Fitting every column to its contents is offered from the header menu
+        self.fit_columns_action = QAction("Fit Columns to Contents", self)
+        self.fit_columns_action.triggered.connect(self.resize_columns_to_contents)
+        if header is not None:
+            header.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+            header.customContextMenuRequested.connect(self._show_header_menu)
 
         # Connect selection signal
-        self.itemSelectionChanged.connect(self.on_selection_changed)
+        selection_model = self.selectionModel()
+        if selection_model is not None:
+            selection_model.selectionChanged.connect(self.on_selection_changed)
 
         # Connect double-click signal
-        self.itemDoubleClicked.connect(self.on_item_double_clicked)
+        self.doubleClicked.connect(self.on_item_double_clicked)
+
+        # Keep Actions widgets on the rows around the viewport
+        scrollbar = self.verticalScrollBar()
+        if scrollbar is not None:
+            scrollbar.valueChanged.connect(self._refresh_action_widgets)
+        self.table_model.rowsInserted.connect(self._refresh_action_widgets)
+        self.table_model.layoutChanged.connect(self._refresh_action_widgets)
+        self.table_model.modelReset.connect(self._forget_action_widgets)
+
+    def _default_column_width(self, column: int) -> int:
+        """Return the initial width of ``column`` from its representative text."""
+        if column == ACTIONS_COLUMN:
+            return ACTIONS_COLUMN_WIDTH
+        metrics = self.fontMetrics()
+        text_width = max(
+            metrics.horizontalAdvance(COLUMN_WIDTH_SAMPLES[column]),
+            metrics.horizontalAdvance(LIST_HEADERS[column]),
+        )
+        return text_width + COLUMN_PADDING
+
+    def resize_columns_to_contents(self) -> None:
+        """Fit every column except the title to its current contents."""
+        for column in range(1, len(LIST_HEADERS)):
+            self.resizeColumnToContents(column)
+
+    def _show_header_menu(self, pos) -> None:
+        """Show the header context menu at ``pos``."""
+        header = self.horizontalHeader()
+        if header is None:
+            return
+        menu = QMenu(self)
+        menu.addAction(self.fit_columns_action)
+        menu.exec(header.mapToGlobal(pos))
+
+    def rowCount(self) -> int:  # noqa: N802
+        """Return the number of rows in the list."""
+        return self.table_model.rowCount()
+
+    def row_data(self, row: int) -> dict[str, Any]:
+        """Return the complete item data shown on ``row``."""
+        return self.table_model.item_data(row)
+
+    def row_snapshot(self, row: int) -> tuple[str, ...]:
+        """Return the rendered text of every data column on ``row``."""
+        return self.table_model.display_row(row)
 
     def add_item(self, item_data: dict[str, Any], service: str | None = None):
         """Add an item to the list."""
-        row = self.rowCount()
-        self.insertRow(row)
-
-        # Title (without track number prefix)
-        title = item_data.get("title", "Unknown")
-        title_item = QTableWidgetItem(title)
-        title_item.setData(Qt.ItemDataRole.UserRole, item_data.get("id"))
-        # Store the complete item data for later retrieval
-        title_item.setData(Qt.ItemDataRole.UserRole + 1, item_data)
-        self.setItem(row, 0, title_item)
-
-        # Artist
-        artist = item_data.get("artist", "")
-        if not artist:
-            artist = "Unknown"
-        artist_item = QTableWidgetItem(artist)
-        self.setItem(row, 1, artist_item)
-
-        # Type (show album name for tracks, truncated if too long)
-        item_type = item_data.get("type", "Album")
-        if item_type == "Track" and "album" in item_data:
-            album_name = item_data["album"]
-            # Truncate album name if longer than 25 characters
-            if len(album_name) > 25:
-                album_name = album_name[:22] + "..."
-            type_display = album_name
-        else:
-            type_display = item_type
-        type_item = QTableWidgetItem(type_display)
-        self.setItem(row, 2, type_item)
-
-        # Year
-        year = item_data.get("year", "")
-        year_item = QTableWidgetItem(str(year) if year else "-")
-        self.setItem(row, 3, year_item)
-
-        # Duration
-        duration = item_data.get("duration_formatted", "")
-        duration_item = QTableWidgetItem(duration or "-")
-        self.setItem(row, 4, duration_item)
-
-        # Tracks (show track number for individual tracks)
-        track_number = item_data.get("track_number")
-        if item_type == "Track" and track_number:
-            tracks_item = QTableWidgetItem(f"Track {track_number}")
-        else:
-            track_count = item_data.get("track_count", 0)
-            tracks_item = QTableWidgetItem(str(track_count) if track_count else "-")
-        self.setItem(row, 5, tracks_item)
-
-        # Quality (mapped to human-readable description)
-        quality = item_data.get("quality", "")
-        service_ = item_data.get("service", service)
-        quality_description = QualityMapper.get_quality_description(service_, quality)
-        quality_item = QTableWidgetItem(quality_description)
-        self.setItem(row, 6, quality_item)
-
-        # Actions
-        actions_widget = self.create_actions_widget(item_data)
-        self.setCellWidget(row, 7, actions_widget)
-
-        # Apply current download status to the new item
-        if hasattr(self, "_current_downloaded_albums"):
+        self.add_items([item_data], service)
+
+    def add_items(
+        self, items: Iterable[dict[str, Any]], service: str | None = None
+    ) -> None:
+        """Add several items with a single model insertion and repaint."""
+        items = list(items)
+        if not items:
+            return
+
+        self.setUpdatesEnabled(False)
+        try:
+            # Actions widgets for the new rows are created by rowsInserted
+            self.table_model.add_items([
+                (item_data, _format_row(item_data, service)) for item_data in items
+            ])
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def resizeEvent(self, event):  # noqa: N802
+        """Cover newly exposed rows with Actions widgets."""
+        super().resizeEvent(event)
+        self._refresh_action_widgets()
+
+    def _action_row_range(self) -> range:
+        """Return the rows that should currently hold an Actions widget."""
+        row_count = self.table_model.rowCount()
+        if row_count == 0:
+            return range(0)
+        first = self.rowAt(0)
+        last = self.rowAt(max(self.viewport().height() - 1, 0))
+        if first < 0:
+            first = 0
+        if last < 0:
+            last = row_count - 1
+        return range(
+            max(first - ACTIONS_ROW_MARGIN, 0),
+            min(last + ACTIONS_ROW_MARGIN, row_count - 1) + 1,
+        )
+
+    def _forget_action_widgets(self) -> None:
+        """Drop the Actions cells tracked for rows removed by a model reset."""
+        self._action_indexes = []
+
+    def _refresh_action_widgets(self, *_args) -> None:
+        """Create Actions widgets near the viewport and release the rest."""
+        rows = self._action_row_range()
+        kept: list[QPersistentModelIndex] = []
+        covered: set[int] = set()
+        for persistent in self._action_indexes:
+            if not persistent.isValid():
+                continue
+            row = persistent.row()
+            if row in rows and not self.isRowHidden(row):
+                kept.append(persistent)
+                covered.add(row)
+            else:
+                # Replacing the index widget deletes the old one
+                self.setIndexWidget(self.table_model.index(row, ACTIONS_COLUMN), None)
+
+        for row in rows:
+            if row in covered or self.isRowHidden(row):
+                continue
+            index = self.table_model.index(row, ACTIONS_COLUMN)
+            item_data = self.row_data(row)
+            self.setIndexWidget(index, self.create_actions_widget(item_data))
+            # Apply current download status to the new widget
             self._apply_download_status_to_row(
                 row, item_data, self._current_downloaded_albums
             )
+            kept.append(QPersistentModelIndex(index))
+        self._action_indexes = kept
 
     def sort_items(self, sort_by: str, descending: bool = False):
         """Sort table rows by logical field mapping.
 
         Supported keys: "title" -> col 0, "artist" -> col 1, "year" -> col 3.
         """
-        column_map = {"title": 0, "artist": 1, "year": 3}
-        column_index = column_map.get(sort_by, 0)
-        # Default ascending order
-        from PyQt6.QtCore import Qt
-
-        self.sortItems(
+        column_index = SORT_COLUMNS.get(sort_by, 0)
+        self.sortByColumn(
             column_index,
             Qt.SortOrder.DescendingOrder if descending else Qt.SortOrder.AscendingOrder,
         )
@@ -252,58 +613,36 @@ class DiscographyListView(QTableWidget):
         layout.addStretch()
         return widget
 
-    def on_selection_changed(self):
+    def on_selection_changed(self, *_args):
         """Handle selection changes."""
-        current_row = self.currentRow()
-        if current_row >= 0:
-            title_item = self.item(current_row, 0)
-            if title_item:
-                item_id = title_item.data(Qt.ItemDataRole.UserRole)
-                if item_id:
-                    self.item_selected.emit(item_id)
-                    # If the selected row represents an album (no track_number), request lazy load
-                    item_data = title_item.data(Qt.ItemDataRole.UserRole + 1) or {}
-                    if (
-                        isinstance(item_data, dict)
-                        and item_data.get("type", "Album") == "Album"
-                        and not item_data.get("track_number")
-                    ):
-                        self.album_details_requested.emit(item_id)
+        if not self._selection_timer.isActive():
+            self._selection_timer.start()
+
+    def _emit_selection(self) -> None:
+        """Report the row that is current once the selection has settled."""
+        current_row = self.currentIndex().row()
+        if 0 <= current_row < self.table_model.rowCount():
+            item_id = self.table_model.row_id(current_row)
+            if item_id:
+                item_data = self.row_data(current_row)
+                self.item_selected.emit(item_id)
+                # If the selected row represents an album (no track_number), request lazy load
+                if item_data.get("type", "Album") == "Album" and not item_data.get(
+                    "track_number"
+                ):
+                    self.album_details_requested.emit(item_id)
 
     def _extract_row_data(self, row: int) -> dict[str, Any]:
         """Extract data from a table row."""
-        row_data = {}
-        for col in range(self.columnCount()):
-            item = self.item(row, col)
-            if item:
-                if col == 0:  # Title column has the item_id in UserRole
-                    row_data["id"] = item.data(Qt.ItemDataRole.UserRole)
-                    row_data["title"] = item.text()
-                elif col == 1:  # Artist column
-                    row_data["artist"] = item.text()
-                elif col == 2:  # Type/Album column
-                    row_data["type"] = item.text()
-                elif col == 3:  # Year column
-                    row_data["year"] = item.text()
-                elif col == 4:  # Duration column
-                    row_data["duration_formatted"] = item.text()
-                elif col == 5:  # Tracks column
-                    row_data["track_count"] = item.text()
-                elif col == 6:  # Quality column
-                    row_data["quality"] = item.text()
-        return row_data
-
-    def on_item_double_clicked(self, item):
-        """Handle double-click events on items."""
-        if not item:
-            return
+        return self.table_model.row_payload(row)
 
-        row = item.row()
-        title_item = self.item(row, 0)
-        if not title_item:
+    def on_item_double_clicked(self, index: QModelIndex | QPersistentModelIndex):
+        """Handle double-click events on rows."""
+        if index is None or not index.isValid():
             return
 
-        item_id = title_item.data(Qt.ItemDataRole.UserRole)
+        row = index.row()
+        item_id = self.table_model.row_id(row)
         if not item_id:
             return
 
@@ -312,22 +651,15 @@ class DiscographyListView(QTableWidget):
 
     def get_tracks_by_album_id(self, album_id: str) -> list[dict[str, Any]]:
         """Get all tracks that belong to a specific album ID."""
-        tracks = []
-        for row in range(self.rowCount()):
-            title_item = self.item(row, 0)  # Title column
-            if title_item:
-                # Get the complete item data
-                item_data = title_item.data(Qt.ItemDataRole.UserRole + 1)
-                if item_data and isinstance(item_data, dict):
-                    # Check if this track belongs to the album
-                    track_album_id = item_data.get("album_id")
-                    if track_album_id == album_id:
-                        tracks.append(item_data)
-        return tracks
+        return [
+            item_data
+            for item_data in self.table_model.items()
+            if item_data.get("album_id") == album_id
+        ]
 
     def clear_items(self):
         """Clear all items from the list."""
-        self.setRowCount(0)
+        self.table_model.clear()
 
     def update_download_statuses(self, downloaded_albums: set):
         """Update download statuses for all items in the list.
@@ -338,14 +670,8 @@ class DiscographyListView(QTableWidget):
         # Store current downloaded albums for new items
         self._current_downloaded_albums = downloaded_albums
 
-        for row in range(self.rowCount()):
-            title_item = self.item(row, 0)
-            if title_item:
-                item_data = title_item.data(Qt.ItemDataRole.UserRole + 1)
-                if item_data and isinstance(item_data, dict):
-                    self._apply_download_status_to_row(
-                        row, item_data, downloaded_albums
-                    )
+        for row, item_data in enumerate(self.table_model.items()):
+            self._apply_download_status_to_row(row, item_data, downloaded_albums)
 
     def _apply_download_status_to_row(
         self, row: int, item_data: dict, downloaded_albums: set
@@ -358,7 +684,9 @@ class DiscographyListView(QTableWidget):
             is_downloaded = (album_id, source) in downloaded_albums
 
             # Get the actions widget (download button)
-            actions_widget = self.cellWidget(row, 7)
+            actions_widget = self.indexWidget(
+                self.table_model.index(row, ACTIONS_COLUMN)
+            )
             if actions_widget:
                 # Update the download button appearance
                 download_btn = actions_widget.findChild(QPushButton)
@@ -393,13 +721,7 @@ class DiscographyListView(QTableWidget):
         """
         self._filter_text = (query_text or "").strip().lower()
         # Iterate rows and toggle visibility
-        for row in range(self.rowCount()):
-            title_item = self.item(row, 0)
-            if not title_item:
-                # If no title cell, default to show
-                self.setRowHidden(row, False)
-                continue
-            item_data = title_item.data(Qt.ItemDataRole.UserRole + 1) or {}
+        for row, item_data in enumerate(self.table_model.items()):
             title = str(item_data.get("title", "")).lower()
             album = str(item_data.get("album", "")).lower()
             if not self._filter_text:
@@ -407,3 +729,4 @@ class DiscographyListView(QTableWidget):
             else:
                 matches = self._filter_text in title or self._filter_text in album
                 self.setRowHidden(row, not matches)
+        self._refresh_action_widgets()
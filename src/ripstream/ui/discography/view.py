@@ -84,26 +84,11 @@ class DiscographyView(QWidget):
         self, downloading_album_ids: set[str], pending_album_ids: set[str]
     ) -> None:
         """Update active album statuses (downloading/pending) and refresh UI."""
-        self._downloading_album_ids = downloading_album_ids or set()
-        self._pending_album_ids = pending_album_ids or set()
-        # Update grid view widgets
-        for widget in self.grid_view.items:
-            album_id = getattr(widget, "item_id", "")
-            if not album_id:
-                continue
-            # Do not override already downloaded tiles
-            if widget.get_status() == "downloaded":
-                continue
-            if album_id in self._downloading_album_ids:
-                widget.set_downloading_status()
-            elif (
-                album_id in self._pending_album_ids
-                and widget.get_status() != "downloaded"
-            ):
-                widget.set_queued_status()
-            elif widget.get_status() in {"queued", "downloading"}:
-                # If no longer active and not downloaded, revert to idle
-                widget.set_idle_status()
+        self._downloading_album_ids = set(downloading_album_ids or ())
+        self._pending_album_ids = set(pending_album_ids or ())
+        self.grid_view.update_active_statuses(
+            self._downloading_album_ids, self._pending_album_ids
+        )
 
     def _ensure_child_views_initialized(self):
         """Ensure child views have the current downloaded albums state."""
@@ -361,8 +346,8 @@ class DiscographyView(QWidget):
         from PyQt6.QtCore import Qt
 
         for row in range(self.list_view.rowCount()):
-            title_item = self.list_view.item(row, 0)
-            if not title_item:
+            title_item = self.list_view.model().index(row, 0)
+            if not title_item.isValid():
                 continue
             row_data = title_item.data(Qt.ItemDataRole.UserRole + 1)
             if isinstance(row_data, dict):
@@ -385,8 +370,8 @@ class DiscographyView(QWidget):
 
         mapping: dict[str, str] = {}
         for row in range(self.list_view.rowCount()):
-            title_item = self.list_view.item(row, 0)
-            if not title_item:
+            title_item = self.list_view.model().index(row, 0)
+            if not title_item.isValid():
                 continue
             row_data = title_item.data(Qt.ItemDataRole.UserRole + 1)
             if not isinstance(row_data, dict):
@@ -415,10 +400,10 @@ class DiscographyView(QWidget):
     def _snapshot_selection(self) -> dict[str, Any]:
         from PyQt6.QtCore import Qt as _Qt
 
-        current_row = self.list_view.currentRow()
+        current_row = self.list_view.currentIndex().row()
         if current_row >= 0:
-            title_item = self.list_view.item(current_row, 0)
-            if title_item:
+            title_item = self.list_view.model().index(current_row, 0)
+            if title_item.isValid():
                 selected_id = title_item.data(_Qt.ItemDataRole.UserRole)
                 if selected_id:
                     return {"selected_list_item_id": selected_id}
@@ -480,9 +465,9 @@ class DiscographyView(QWidget):
         from PyQt6.QtCore import Qt as _Qt
 
         for row in range(self.list_view.rowCount()):
-            title_item = self.list_view.item(row, 0)
-            if title_item and title_item.data(_Qt.ItemDataRole.UserRole) == selected_id:
-                self.list_view.setCurrentCell(row, 0)
+            title_item = self.list_view.model().index(row, 0)
+            if title_item.data(_Qt.ItemDataRole.UserRole) == selected_id:
+                self.list_view.setCurrentIndex(title_item)
                 break
 
     def _enrich_album_artwork_urls_from_list(self) -> None:
@@ -490,8 +475,8 @@ class DiscographyView(QWidget):
 
         album_to_art_url: dict[str, str] = {}
         for row in range(self.list_view.rowCount()):
-            title_item = self.list_view.item(row, 0)
-            if not title_item:
+            title_item = self.list_view.model().index(row, 0)
+            if not title_item.isValid():
                 continue
             row_data = title_item.data(_Qt2.ItemDataRole.UserRole + 1)
             if not isinstance(row_data, dict):
@@ -529,9 +514,10 @@ class DiscographyView(QWidget):
         if item_id in self.pending_artwork:
             self._consumed_artwork_ids.add(item_id)
 
-        # Maintain sorting live if already applied
+        # Maintain sorting live if already applied; the list view inserts
+        # new rows in sorted position itself
         if self._sort_applied:
-            self._apply_sort_to_views()
+            self._apply_sort_to_views(include_list=False)
         # Maintain filtering live
         self._apply_search_filter()
 
@@ -545,12 +531,7 @@ class DiscographyView(QWidget):
         album_id = album_info.get("id", "")
 
         # Only add album to grid view if it's not already present
-        grid_has_album = False
-        items_attr = getattr(self.grid_view, "items", [])
-        for widget in items_attr:
-            if hasattr(widget, "item_id") and widget.item_id == album_id:
-                grid_has_album = True
-                break
+        grid_has_album = self.grid_view.has_item(album_id)
 
         if not grid_has_album and (
             tracks
@@ -598,21 +579,23 @@ class DiscographyView(QWidget):
                 self._consumed_artwork_ids.add(album_id)
 
         # For list view, add individual tracks (always add tracks if they exist)
+        # Add album_id to track data so we can find tracks by album later
+        self.list_view.add_items(
+            ({**track, "album_id": album_id} for track in tracks), service
+        )
         for track in tracks:
-            # Add album_id to track data so we can find tracks by album later
-            track_with_album_id = track.copy()
-            track_with_album_id["album_id"] = album_id
-            self.list_view.add_item(track_with_album_id, service)
             # Track consumed artwork for tracks too
             track_id = track.get("id", "")
             if track_id in self.pending_artwork:
                 self._consumed_artwork_ids.add(track_id)
 
-        # Maintain sorting live if already applied
+        # Maintain sorting live if already applied; the list view inserts
+        # new rows in sorted position itself
         if self._sort_applied:
-            self._apply_sort_to_views()
-        # Maintain filtering live
-        self._apply_search_filter()
+            self._apply_sort_to_views(include_list=False)
+        # Maintain filtering live; a lightweight album (no tracks yet)
+        # leaves the list rows untouched
+        self._apply_search_filter(include_list=bool(tracks))
 
     def update_item_artwork(self, item_id: str, pixmap: QPixmap):
         """Update artwork for a specific item in both views."""
@@ -651,6 +634,7 @@ class DiscographyView(QWidget):
 
         content_type = metadata.get("content_type", "")
         service = metadata.get("service")
+        list_rows_before = self.list_view.rowCount()
 
         if content_type == "album":
             # Handle album content - single album in grid, tracks in list
@@ -686,11 +670,14 @@ class DiscographyView(QWidget):
         # Update album widgets opacity based on current downloaded albums
         self._update_album_downloaded_status()
 
-        # Reapply current sort after content changes (if applied)
-        self._apply_sort_to_views()
+        # Reapply current sort and filter after content changes; the list
+        # view keeps its rows sorted on insert, and is only re-filtered when
+        # rows were added to it
+        self._apply_sort_to_views(include_list=False)
         self._update_sort_ui()
-        # Reapply filter after content changes
-        self._apply_search_filter()
+        self._apply_search_filter(
+            include_list=self.list_view.rowCount() != list_rows_before
+        )
 
     def add_album_progressively(self, album_metadata: dict[str, Any]):
         """Add a single album to the view progressively during streaming."""
@@ -704,14 +691,12 @@ class DiscographyView(QWidget):
             album_info = album_metadata.get("album_info", {})
             tracks = album_metadata.get("items", [])
 
-            # Add the album content to both views
+            # Add the album content to both views; this also keeps any
+            # applied sort and filter live
             if tracks or album_info:
                 self.add_album_content(album_info, tracks, service)
                 # Update opacity for the newly added album
                 self._update_album_downloaded_status()
-                # Maintain sorting live during progressive updates if applied
-                if self._sort_applied:
-                    self._apply_sort_to_views()
 
     def sort_items(self, sort_by: str):
         """Sort items by the specified criteria.
@@ -733,8 +718,12 @@ class DiscographyView(QWidget):
         self._apply_sort_to_views()
         self._update_sort_ui()
 
-    def _apply_sort_to_views(self) -> None:
-        """Apply current sort settings to both views."""
+    def _apply_sort_to_views(self, *, include_list: bool = True) -> None:
+        """Apply current sort settings to both views.
+
+        Args:
+            include_list: Whether to re-sort the list view as well as the grid.
+        """
         if not getattr(self, "_sort_applied", False):
             return
 
@@ -746,7 +735,7 @@ class DiscographyView(QWidget):
             if callable(sort_func):
                 sort_func(sort_key, descending)
 
-        if hasattr(self, "list_view") and self.list_view:
+        if include_list and hasattr(self, "list_view") and self.list_view:
             sort_func = getattr(self.list_view, "sort_items", None)
             if callable(sort_func):
                 sort_func(sort_key, descending)
@@ -801,11 +790,14 @@ class DiscographyView(QWidget):
         """Apply filter after debounce timeout."""
         self._apply_search_filter()
 
-    def _apply_search_filter(self) -> None:
+    def _apply_search_filter(self, *, include_list: bool = True) -> None:
         """Apply current search text as filter to both views.
 
         - Grid view filters by album title
         - List view filters by album or track title
+
+        Args:
+            include_list: Whether to re-filter the list view as well as the grid.
         """
         query = ""
         if self.search_input is not None:
@@ -816,7 +808,7 @@ class DiscographyView(QWidget):
             if callable(set_filter):
                 set_filter(query)
 
-        if hasattr(self, "list_view") and self.list_view:
+        if include_list and hasattr(self, "list_view") and self.list_view:
             set_filter = getattr(self.list_view, "set_filter", None)
             if callable(set_filter):
                 set_filter(query)
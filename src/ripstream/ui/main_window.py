@@ -80,7 +80,7 @@ class MainWindow(QMainWindow):
     def _connect_metadata_signals(self):
         """Connect metadata service signals to handlers."""
         self.metadata_service.metadata_ready.connect(self.handle_metadata_ready)
-        self.metadata_service.album_ready.connect(self.handle_album_ready)
+        self.metadata_service.albums_ready.connect(self.handle_albums_ready)
         self.metadata_service.artwork_ready.connect(self.handle_artwork_ready)
         self.metadata_service.progress_updated.connect(self.handle_metadata_progress)
         self.metadata_service.artist_progress_updated.connect(
@@ -526,24 +526,25 @@ class MainWindow(QMainWindow):
                 self.metadata_service.get_last_parsed_url()
             )
 
-    def handle_album_ready(self, album_metadata: dict):
-        """Handle individual album fetched during streaming."""
-        try:
-            # Add the album progressively to the discography view
-            discography_view = self.ui_manager.get_discography_view()
-            if discography_view:
-                discography_view.add_album_progressively(album_metadata)
-
-            # Update status to show progress
-            album_info = album_metadata.get("album_info", {})
-            if album_info:
-                album_title = album_info.get("title", "Unknown Album")
-                self.ui_manager.update_status(f"Loaded album: {album_title}")
-
-        except Exception:
-            logger.exception("Failed to handle album ready")
-
-        # Save snapshot incrementally for streaming scenarios
+    def handle_albums_ready(self, albums: list[dict]):
+        """Handle a batch of albums fetched during streaming."""
+        # Add the albums progressively to the discography view; one bad album
+        # must not drop the rest of its batch
+        discography_view = self.ui_manager.get_discography_view()
+        if discography_view:
+            for album_metadata in albums:
+                try:
+                    discography_view.add_album_progressively(album_metadata)
+                except Exception:
+                    logger.exception("Failed to handle album ready")
+
+        # Update status to show progress
+        album_info = albums[-1].get("album_info", {}) if albums else {}
+        if album_info:
+            album_title = album_info.get("title", "Unknown Album")
+            self.ui_manager.update_status(f"Loaded album: {album_title}")
+
+        # Save snapshot incrementally for streaming scenarios, once per batch
         try:
             self._save_working_session()
         except Exception:
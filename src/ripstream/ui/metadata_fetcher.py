@@ -25,6 +25,11 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Streamed albums are emitted in batches of at most this many
+ALBUM_BATCH_SIZE = 16
+# Longest time a streamed album waits in the buffer before being emitted
+ALBUM_BATCH_WINDOW_SECONDS = 0.05
+
 
 class AuthenticationError(Exception):
     """Custom exception for authentication failures."""
@@ -34,7 +39,9 @@ class MetadataFetcher(QThread):
     """Service-agnostic background thread for fetching metadata from streaming services."""
 
     metadata_fetched = pyqtSignal(dict)  # metadata_dict
-    album_fetched = pyqtSignal(dict)  # album_metadata for progressive loading
+    albums_fetched_batch = pyqtSignal(
+        list
+    )  # album_metadata list for progressive loading
     artwork_fetched = pyqtSignal(str, QPixmap)  # item_id, pixmap
     error_occurred = pyqtSignal(str)  # error_message
     progress_updated = pyqtSignal(int, str)  # progress_percent, status_message
@@ -51,6 +58,7 @@ class MetadataFetcher(QThread):
     ):
         super().__init__(parent)
         self.parsed_url = parsed_url
+        self._is_artist = parsed_url.content_type == ContentType.ARTIST
         self.credentials = credentials or {}
         self.cache_dir = Path.home() / ".cache" / "ripstream"
         self.cache_dir.mkdir(parents=True, exist_ok=True)
@@ -61,6 +69,10 @@ class MetadataFetcher(QThread):
         # Track background artwork tasks to prevent garbage collection
         self._artwork_tasks: set[asyncio.Task] = set()
 
+        # Streamed albums waiting to be emitted as one batch
+        self._album_buffer: list[dict[str, Any]] = []
+        self._album_flush_handle: asyncio.TimerHandle | None = None
+
         # Thread-safe counter for artist album fetching
         self._remaining_items_lock = threading.Lock()
         self._remaining_items = 0
@@ -113,6 +125,7 @@ class MetadataFetcher(QThread):
 
             # Fetch metadata based on content type
             metadata_result = await self._fetch_content_metadata()
+            self._flush_album_buffer()
 
             # For artist content with streaming, emit initial metadata but skip artwork
             # since albums are being streamed individually with their own artwork
@@ -140,6 +153,9 @@ class MetadataFetcher(QThread):
             logger.exception("Failed to fetch metadata")
             self.error_occurred.emit(f"Failed to fetch metadata: {e!s}")
         finally:
+            # Emit any albums still buffered if streaming stopped early
+            self._flush_album_buffer()
+
             # Ensure all background artwork tasks complete before the loop exits
             try:
                 await self._await_outstanding_artwork_tasks()
@@ -202,29 +218,56 @@ class MetadataFetcher(QThread):
         """Execute an action when an album is fetched."""
         # No filtering here; streaming filter is applied provider-side to avoid double work
 
-        # Emit the album_fetched signal to update UI progressively
-        self.album_fetched.emit(album_metadata)
+        # Buffer the album so the UI receives albums in batches
+        self._album_buffer.append(album_metadata)
 
         # Decrement the remaining items counter only for artist fetching
-        if self.parsed_url.content_type == ContentType.ARTIST:
+        if self._is_artist:
             self._decrement_remaining_items()
 
-        # Also fetch artwork for this individual album
-        import asyncio
-
         try:
             # Check if there's a running event loop
             loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No event loop running, emit straight away
+            # This can happen during testing or when called outside async context
+            self._flush_album_buffer()
+            return
+
+        # Emit a full batch now, otherwise after a short coalescing window
+        if len(self._album_buffer) >= ALBUM_BATCH_SIZE:
+            self._flush_album_buffer()
+        elif self._album_flush_handle is None:
+            self._album_flush_handle = loop.call_later(
+                ALBUM_BATCH_WINDOW_SECONDS, self._flush_album_buffer
+            )
+
+    def _flush_album_buffer(self) -> None:
+        """Emit all buffered albums as one batch and fetch their artwork."""
+        if self._album_flush_handle is not None:
+            self._album_flush_handle.cancel()
+            self._album_flush_handle = None
+
+        if not self._album_buffer:
+            return
+
+        albums, self._album_buffer = self._album_buffer, []
+        self.albums_fetched_batch.emit(albums)
+
+        # Fetch artwork only after the albums are emitted so the UI has them
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No event loop running, skip artwork fetching
+            return
+
+        for album_metadata in albums:
             # Store task reference to prevent garbage collection
             task = loop.create_task(self._fetch_album_artwork_async(album_metadata))
             self._artwork_tasks.add(task)
 
             # Remove task from set when it completes to prevent memory leaks
             task.add_done_callback(self._artwork_tasks.discard)
-        except RuntimeError:
-            # No event loop running, skip artwork fetching
-            # This can happen during testing or when called outside async context
-            pass
 
     async def _fetch_album_artwork_async(self, album_metadata: dict[str, Any]):
         """Fetch artwork for a single album asynchronously."""
@@ -21,6 +21,7 @@ class MetadataService(QObject):
 
     metadata_ready = pyqtSignal(dict)  # metadata_dict
     album_ready = pyqtSignal(dict)  # album_metadata for progressive loading
+    albums_ready = pyqtSignal(list)  # album_metadata batch for progressive loading
     artwork_ready = pyqtSignal(str, QPixmap)  # item_id, pixmap
     progress_updated = pyqtSignal(int, str)  # progress_percent, status_message
     artist_progress_updated = pyqtSignal(
@@ -54,7 +55,7 @@ class MetadataService(QObject):
             parsed_url, credentials, artist_item_filter=artist_item_filter
         )
         self.current_fetcher.metadata_fetched.connect(self.metadata_ready.emit)
-        self.current_fetcher.album_fetched.connect(self.album_ready.emit)
+        self.current_fetcher.albums_fetched_batch.connect(self._on_albums_fetched)
         self.current_fetcher.artwork_fetched.connect(self.artwork_ready.emit)
         self.current_fetcher.progress_updated.connect(self.progress_updated.emit)
         self.current_fetcher.artist_progress_updated.connect(
@@ -65,6 +66,15 @@ class MetadataService(QObject):
         # Start fetching
         self.current_fetcher.start()
 
+    def _on_albums_fetched(self, albums: list[dict[str, Any]]):
+        """Forward a batch of streamed albums to listeners."""
+        self.albums_ready.emit(albums)
+
+        # Only split the batch for listeners still connected per album
+        if self.receivers(self.album_ready):
+            for album_metadata in albums:
+                self.album_ready.emit(album_metadata)
+
     def get_last_parsed_url(self) -> ParsedURL | None:
         """Return the last fetcher's parsed URL if available."""
         if self.current_fetcher and hasattr(self.current_fetcher, "parsed_url"):
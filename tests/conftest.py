@@ -3,14 +3,23 @@
 
 """Global pytest configuration for ripstream tests."""
 
+import os
+
 # Configure pytest-asyncio for all async tests
 pytest_plugins = ["pytest_asyncio"]
 
+# RIPSTREAM_SKIP_UI=1 skips collecting the Qt widget suites entirely, so
+# targeted runs (e.g. metadata providers) never import the widget tree
+collect_ignore_glob = (
+    ["ui/discography/*"] if os.environ.get("RIPSTREAM_SKIP_UI") == "1" else []
+)
+
 
 # Mark all async test functions with asyncio marker
 def pytest_configure(config):
     """Configure pytest with asyncio markers."""
     config.addinivalue_line("markers", "asyncio: mark test as async")
+    config.addinivalue_line("markers", "ui: Qt widget test (deselect with -m 'not ui')")
 
 
 # Note: Async tests should be manually marked with @pytest.mark.asyncio
@@ -10,7 +10,7 @@ from unittest.mock import MagicMock, Mock
 
 import pytest
 from PyQt6.QtCore import QSettings
-from PyQt6.QtGui import QPixmap
+from PyQt6.QtGui import QPixmap, QPixmapCache
 from PyQt6.QtWidgets import QApplication
 
 # Import qtbot from pytest-qt if available
@@ -26,6 +26,9 @@ from ripstream.models.db_manager import DatabaseManager
 from ripstream.models.download_service import DownloadService
 from ripstream.models.enums import StreamingSource
 
+# QPixmapCache key under which the shared sample artwork is stored
+SAMPLE_PIXMAP_CACHE_KEY = "ripstream-tests:sample-pixmap"
+
 
 @pytest.fixture(scope="session")
 def qapp():
@@ -58,6 +61,17 @@ def temp_db():
     db_path.unlink(missing_ok=True)
 
 
+@pytest.fixture(scope="session")
+def shared_dbm():
+    """Create one in-memory database shared by tests that clear it afterwards."""
+    db_manager = DatabaseManager(":memory:")
+    db_manager.initialize()
+
+    yield db_manager
+
+    db_manager.close()
+
+
 @pytest.fixture
 def mock_download_service(temp_db):
     """Create a download service with temporary database."""
@@ -93,10 +107,20 @@ def sample_user_config():
 
 
 @pytest.fixture
-def sample_pixmap():
-    """Create a sample QPixmap for testing."""
+def sample_pixmap(qapp):
+    """Return the sample QPixmap shared through ``QPixmapCache``.
+
+    The pixmap is painted once and looked up like production artwork, so
+    every test reuses the same backing store. QPixmap is implicitly shared,
+    so tests that paint on it detach a copy.
+    """
+    cached = QPixmapCache.find(SAMPLE_PIXMAP_CACHE_KEY)
+    if cached is not None and not cached.isNull():
+        return cached
+
     pixmap = QPixmap(100, 100)
     pixmap.fill()
+    QPixmapCache.insert(SAMPLE_PIXMAP_CACHE_KEY, pixmap)
     return pixmap
 
 
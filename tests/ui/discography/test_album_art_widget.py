@@ -10,6 +10,8 @@ from PyQt6.QtWidgets import QLabel, QVBoxLayout
 
 from ripstream.ui.discography.album_art_widget import AlbumArtWidget
 
+pytestmark = pytest.mark.ui
+
 
 class TestAlbumArtWidget:
     """Test the AlbumArtWidget class."""
@@ -31,6 +33,12 @@ class TestAlbumArtWidget:
         assert widget.size().width() == 180
         assert widget.size().height() == 260
 
+    def test_size_hint_is_constant_tile_size(self, widget):
+        """Size hints return the shared class-level tile size."""
+        assert widget.sizeHint() == AlbumArtWidget.TILE_SIZE
+        assert widget.minimumSizeHint() == AlbumArtWidget.TILE_SIZE
+        assert widget.sizeHint() == widget.size()
+
     def test_widget_layout(self, widget):
         """Test widget has correct layout structure."""
         layout = widget.layout()
@@ -64,6 +72,20 @@ class TestAlbumArtWidget:
         assert new_pixmap.size().width() <= 180
         assert new_pixmap.size().height() <= 180
 
+    def test_update_artwork_reuses_prepared_pixmap(self, qapp, sample_pixmap):
+        """The same source artwork is scaled once and shared between tiles."""
+        first = AlbumArtWidget({"id": "a1", "title": "First", "artist": "A"})
+        second = AlbumArtWidget({"id": "a2", "title": "Second", "artist": "A"})
+
+        first.update_artwork(sample_pixmap)
+        second.update_artwork(sample_pixmap)
+
+        first_pixmap = first.art_label.pixmap()
+        second_pixmap = second.art_label.pixmap()
+        assert first_pixmap.cacheKey() == second_pixmap.cacheKey()
+        assert first_pixmap.deviceIndependentSize().width() <= 180
+        assert first_pixmap.deviceIndependentSize().height() <= 180
+
     def test_update_artwork_with_null_pixmap(self, widget):
         """Test updating artwork with null pixmap doesn't change anything."""
         original_pixmap = widget.art_label.pixmap()
@@ -157,6 +179,16 @@ class TestAlbumArtWidget:
             assert pixmap.size().width() == 180
             assert pixmap.size().height() == 180
 
+    def test_placeholder_shared_between_same_letter(self, qapp):
+        """Placeholders for titles with the same first letter are painted once."""
+        first = AlbumArtWidget({"id": "1", "title": "Alpha", "artist": "Artist"})
+        second = AlbumArtWidget({"id": "2", "title": "alpine", "artist": "Artist"})
+        other = AlbumArtWidget({"id": "3", "title": "Beta", "artist": "Artist"})
+
+        first_key = first.art_label.pixmap().cacheKey()
+        assert second.art_label.pixmap().cacheKey() == first_key
+        assert other.art_label.pixmap().cacheKey() != first_key
+
     def test_widget_styling(self, widget):
         """Test widget has correct styling applied."""
         style_sheet = widget.styleSheet()
@@ -182,6 +214,20 @@ class TestAlbumArtWidget:
         assert result_pixmap.size().width() <= 180
         assert result_pixmap.size().height() <= 180
 
+    def test_update_artwork_rounds_corners(self, widget):
+        """Artwork keeps its content but has transparent rounded corners."""
+        artwork = QPixmap(300, 200)
+        artwork.fill(QColor("red"))
+
+        widget.update_artwork(artwork)
+
+        image = widget.art_label.pixmap().toImage()
+        assert image.pixelColor(0, 0).alpha() == 0
+        assert image.pixelColor(image.width() - 1, image.height() - 1).alpha() == 0
+        assert image.pixelColor(image.width() // 2, image.height() // 2) == QColor(
+            "red"
+        )
+
     def test_widget_with_small_pixmap(self, widget):
         """Test widget handles small pixmaps correctly."""
         # Create a small pixmap
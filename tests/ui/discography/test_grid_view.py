@@ -3,6 +3,8 @@
 
 """Tests for album art grid view."""
 
+from unittest.mock import patch
+
 import pytest
 from PyQt6.QtCore import Qt
 from PyQt6.QtWidgets import QGridLayout, QScrollArea, QWidget
@@ -10,6 +12,8 @@ from PyQt6.QtWidgets import QGridLayout, QScrollArea, QWidget
 from ripstream.ui.discography.album_art_widget import AlbumArtWidget
 from ripstream.ui.discography.grid_view import AlbumArtGridView
 
+pytestmark = pytest.mark.ui
+
 
 class TestAlbumArtGridView:
     """Test the AlbumArtGridView class."""
@@ -99,6 +103,37 @@ class TestAlbumArtGridView:
         grid_view.sort_items("year", descending=True)
         assert [w.item_data.get("year", 0) for w in grid_view.items] == [2021, 2020]
 
+    def test_sort_columns_normalized_once_per_tile(self, grid_view):
+        """Sort/filter values are normalized when a tile is added."""
+        grid_view.add_item({"id": "1", "title": "Zeta", "artist": "B", "year": "-"})
+        grid_view.add_item({"id": "2", "title": None, "artist": "a", "year": "1999"})
+        first, second = grid_view.items
+
+        assert grid_view._columns["title"] == {first: "zeta", second: ""}
+        assert grid_view._columns["artist"] == {first: "b", second: "a"}
+        assert grid_view._columns["year"] == {first: 0, second: 1999}
+
+        grid_view.sort_items("year", descending=True)
+        assert [w.item_id for w in grid_view.items] == ["2", "1"]
+
+        grid_view.clear_items()
+        assert all(not column for column in grid_view._columns.values())
+
+    def test_sort_items_already_sorted_skips_relayout(self, grid_view):
+        """Sorting an already ordered grid does not re-flow the tiles."""
+        for data in ({"id": "1", "title": "A"}, {"id": "2", "title": "B"}):
+            grid_view.add_item(data)
+
+        relayouts = []
+        grid_view.update_grid_layout = lambda force=False: relayouts.append(force)
+
+        grid_view.sort_items("title")
+        assert relayouts == []
+
+        grid_view.sort_items("title", descending=True)
+        assert relayouts == [True]
+        assert [w.item_id for w in grid_view.items] == ["2", "1"]
+
     def test_item_signal_connection(self, grid_view, sample_album_item, qtbot):
         """Test that item signals are connected properly."""
         with qtbot.waitSignal(grid_view.item_selected, timeout=1000) as blocker:
@@ -108,6 +143,15 @@ class TestAlbumArtGridView:
 
         assert blocker.args == [sample_album_item["id"]]
 
+    def test_download_request_forwarded(self, grid_view, sample_album_item, qtbot):
+        """Tile download requests are re-emitted by the grid."""
+        grid_view.add_item(sample_album_item)
+
+        with qtbot.waitSignal(grid_view.download_requested, timeout=1000) as blocker:
+            grid_view.items[0].download_requested.emit(sample_album_item)
+
+        assert blocker.args == [sample_album_item]
+
     def test_update_active_statuses(self, grid_view, sample_album_item):
         """Active statuses update individual tiles without affecting others."""
         grid_view.add_item(sample_album_item)
@@ -122,6 +166,23 @@ class TestAlbumArtGridView:
         grid_view.update_active_statuses(set(), set())
         assert w.get_status() == "idle"
 
+    def test_update_active_statuses_skips_unchanged_tiles(
+        self, grid_view, sample_album_item
+    ):
+        """Repeating the same statuses does not restyle tiles again."""
+        grid_view.add_item(sample_album_item)
+        w = grid_view.items[0]
+        album_id = sample_album_item["id"]
+
+        with patch.object(
+            w, "set_queued_status", wraps=w.set_queued_status
+        ) as set_queued:
+            for _ in range(100):
+                grid_view.update_active_statuses(set(), {album_id})
+
+        assert w.get_status() == "queued"
+        set_queued.assert_called_once_with()
+
     def test_grid_positioning(self, grid_view):
         """Test items are positioned correctly in grid."""
         # Add several items to test grid positioning
@@ -338,6 +399,37 @@ class TestAlbumArtGridView:
             item_widget = layout.itemAt(i).widget()
             assert isinstance(item_widget, AlbumArtWidget)
 
+    def test_update_grid_layout_skips_when_columns_unchanged(self, grid_view):
+        """Resizes that keep the column count do not re-place the tiles."""
+        grid_view.resize(440, 400)
+        for i in range(4):
+            grid_view.add_item({"id": f"item_{i}", "title": f"Item {i}"})
+
+        layout = grid_view.grid_layout
+        positions = [layout.getItemPosition(i) for i in range(layout.count())]
+
+        grid_view.resize(460, 400)  # Still two columns
+        grid_view.update_grid_layout()
+
+        assert [layout.getItemPosition(i) for i in range(layout.count())] == positions
+
+    def test_add_item_reflows_after_width_change(self, grid_view):
+        """Adding a tile after the column count changed re-flows existing tiles."""
+        grid_view.resize(440, 400)
+        for i in range(3):
+            grid_view.add_item({"id": f"item_{i}", "title": f"Item {i}"})
+
+        grid_view.resize(660, 400)
+        grid_view.add_item({"id": "item_3", "title": "Item 3"})
+
+        layout = grid_view.grid_layout
+        cells = {
+            layout.itemAt(i).widget().item_id: layout.getItemPosition(i)[:2]
+            for i in range(layout.count())
+        }
+        assert cells["item_2"] == (0, 2)
+        assert cells["item_3"] == (1, 0)
+
     def test_add_item_with_missing_id(self, grid_view):
         """Test adding item with missing ID field."""
         item_data = {"title": "Test Item", "artist": "Test Artist"}  # No ID
@@ -347,6 +439,20 @@ class TestAlbumArtGridView:
         # Should use empty string as default ID
         assert grid_view.items[0].item_id == ""
 
+    def test_id_index_skips_missing_ids(self, grid_view, sample_album_item):
+        """Only tiles with an id are indexed; id-less tiles never collide."""
+        grid_view.add_item({"title": "First", "artist": "A"})
+        grid_view.add_item({"title": "Second", "artist": "A"})
+        grid_view.add_item(sample_album_item)
+
+        assert len(grid_view.items) == 3
+        assert grid_view.has_item(sample_album_item["id"])
+        assert not grid_view.has_item("")
+        assert grid_view._items_by_id == {sample_album_item["id"]: [grid_view.items[2]]}
+
+        grid_view.clear_items()
+        assert not grid_view.has_item(sample_album_item["id"])
+
     def test_add_item_with_none_pending_artwork(self, grid_view, sample_album_item):
         """Test adding item with None pending artwork."""
         grid_view.add_item(sample_album_item, None)
@@ -370,27 +476,49 @@ class TestAlbumArtGridView:
         assert current_pixmap is not None
 
     def test_clear_items_calls_delete_later(self, grid_view, sample_album_item):
-        """Test that clear_items properly calls deleteLater on widgets."""
+        """Test that clear_items schedules one deleteLater on the tiles host."""
         # Add items
         grid_view.add_item(sample_album_item)
-        item_widget = grid_view.items[0]
+        old_host = grid_view._tiles_host
+        old_layout = grid_view.grid_layout
 
         # Mock deleteLater to verify it's called
         delete_called = False
-        original_delete = item_widget.deleteLater
+        original_delete = old_host.deleteLater
 
         def mock_delete():
             nonlocal delete_called
             delete_called = True
             original_delete()
 
-        item_widget.deleteLater = mock_delete
+        old_host.deleteLater = mock_delete
 
         # Clear items
         grid_view.clear_items()
 
         assert delete_called
         assert len(grid_view.items) == 0
+        assert grid_view._tiles_host is not old_host
+        assert grid_view.grid_layout is not old_layout
+        assert grid_view.grid_layout.count() == 0
+        assert grid_view.grid_layout.spacing() == 16
+
+    def test_clear_items_deletes_tiles_with_host(self, grid_view, sample_album_item):
+        """Tiles are destroyed together with the tiles host."""
+        from PyQt6 import sip
+        from PyQt6.QtCore import QCoreApplication, QEvent
+
+        grid_view.add_item(sample_album_item)
+        tile = grid_view.items[0]
+
+        grid_view.clear_items()
+        QCoreApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+
+        assert sip.isdeleted(tile)
+
+        # The fresh host accepts new tiles
+        grid_view.add_item(sample_album_item)
+        assert grid_view.grid_layout.count() == 1
 
     def test_grid_layout_alignment(self, grid_view):
         """Test that grid layout has correct alignment flags."""
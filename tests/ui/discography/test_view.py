@@ -4,6 +4,7 @@
 """Tests for discography view."""
 
 import pytest
+from PyQt6.QtCore import Qt
 from PyQt6.QtWidgets import (
     QButtonGroup,
     QStackedWidget,
@@ -16,14 +17,95 @@ from ripstream.ui.discography.grid_view import AlbumArtGridView
 from ripstream.ui.discography.list_view import DiscographyListView
 from ripstream.ui.discography.view import DiscographyView
 
+pytestmark = pytest.mark.ui
+
+# Widgets every DiscographyView exposes to its callers
+REQUIRED_ATTRIBUTES = frozenset({
+    "view_button_group",
+    "grid_view_btn",
+    "list_view_btn",
+    "sort_title_btn",
+    "sort_artist_btn",
+    "sort_year_btn",
+    "stacked_widget",
+    "grid_view",
+    "list_view",
+})
+
+# View switches driven through one DiscographyView, including repeats
+VIEW_SWITCH_SEQUENCE = ("list", "grid", "grid", "list", "grid")
+
+
+def _reset_view(view: DiscographyView) -> None:
+    """Return a shared DiscographyView to the state of a freshly built one.
+
+    The view's own entry points are used where one exists; sort state has no
+    public reset, so it is cleared on the view and the list model directly.
+    """
+    view.clear_all()
+    assert view.search_input is not None
+    view.search_input.setText("")
+    assert view._search_timer is not None
+    view._search_timer.stop()
+    view.update_downloaded_albums(set())
+    view.update_active_album_statuses(set(), set())
+    view._current_sort_key = "title"
+    view._current_sort_desc = False
+    view._sort_applied = False
+    view.list_view.horizontalHeader().setSortIndicator(-1, Qt.SortOrder.AscendingOrder)
+    view.list_view.table_model.sort(-1)
+    # The exclusive sort group refuses to uncheck its last checked button;
+    # switch_view also re-applies the now empty search filter
+    view.sort_button_group.setExclusive(False)
+    view.switch_view("grid")
+    view.sort_button_group.setExclusive(True)
+
+
+@pytest.fixture(scope="class")
+def shared_view(qapp):
+    """Build one DiscographyView for a whole test class.
+
+    Yields the view with its freshly built session snapshot, which each reset
+    is checked against so state added to the view later cannot leak silently.
+    """
+    view = DiscographyView()
+    yield view, view.build_session_snapshot()
+    view.deleteLater()
+
+
+@pytest.fixture
+def capture():
+    """Record emissions of synchronously emitted signals without an event loop.
+
+    Connections are dropped at teardown so the shared view does not keep them.
+    """
+    connections = []
+
+    def _capture(signal) -> list[tuple]:
+        calls: list[tuple] = []
+
+        def slot(*args):
+            calls.append(args)
+
+        signal.connect(slot)
+        connections.append((signal, slot))
+        return calls
+
+    yield _capture
+    for signal, slot in connections:
+        signal.disconnect(slot)
+
 
 class TestDiscographyView:
     """Test the DiscographyView class."""
 
     @pytest.fixture
-    def discography_view(self, qapp):
-        """Create a DiscographyView for testing."""
-        return DiscographyView()
+    def discography_view(self, shared_view):
+        """Provide the shared DiscographyView and reset it after each test."""
+        view, fresh_snapshot = shared_view
+        yield view
+        _reset_view(view)
+        assert view.build_session_snapshot() == fresh_snapshot
 
     def test_view_creation(self, discography_view: DiscographyView):
         """Test creating a DiscographyView."""
@@ -40,10 +122,6 @@ class TestDiscographyView:
 
     def test_view_toggle_buttons(self, discography_view: DiscographyView):
         """Test view toggle buttons setup."""
-        assert hasattr(discography_view, "view_button_group")
-        assert hasattr(discography_view, "grid_view_btn")
-        assert hasattr(discography_view, "list_view_btn")
-
         assert isinstance(discography_view.view_button_group, QButtonGroup)
         assert isinstance(discography_view.grid_view_btn, QToolButton)
         assert isinstance(discography_view.list_view_btn, QToolButton)
@@ -52,11 +130,9 @@ class TestDiscographyView:
         assert discography_view.grid_view_btn.isChecked() is True
         assert discography_view.list_view_btn.isChecked() is False
 
-    def test_sort_buttons(self, discography_view: DiscographyView):
-        """Test sort buttons setup."""
-        assert hasattr(discography_view, "sort_title_btn")
-        assert hasattr(discography_view, "sort_artist_btn")
-        assert hasattr(discography_view, "sort_year_btn")
+    def test_required_attributes(self, discography_view: DiscographyView):
+        """Test the view exposes its buttons, stack and child views."""
+        assert set(dir(discography_view)) >= REQUIRED_ATTRIBUTES
 
     def test_initial_sort_ui_inactive(self, discography_view: DiscographyView):
         """On initial load, no sort should be visually active and no arrows shown."""
@@ -69,10 +145,6 @@ class TestDiscographyView:
 
     def test_stacked_widget_setup(self, discography_view: DiscographyView):
         """Test stacked widget and views setup."""
-        assert hasattr(discography_view, "stacked_widget")
-        assert hasattr(discography_view, "grid_view")
-        assert hasattr(discography_view, "list_view")
-
         assert isinstance(discography_view.stacked_widget, QStackedWidget)
         assert isinstance(discography_view.grid_view, AlbumArtGridView)
         assert isinstance(discography_view.list_view, DiscographyListView)
@@ -80,80 +152,71 @@ class TestDiscographyView:
         # Check that views are added to stacked widget
         assert discography_view.stacked_widget.count() == 2
 
-    def test_switch_to_grid_view(self, discography_view: DiscographyView):
-        """Test switching to grid view."""
-        # Start with list view
+    def test_view_switch_sequence(
+        self, discography_view: DiscographyView, sample_album_metadata
+    ):
+        """Switching views updates the stack and buttons and keeps content."""
+        views = {"grid": discography_view.grid_view, "list": discography_view.list_view}
+        track_count = len(sample_album_metadata["items"])
+
+        # Content set while in list view keeps the list view current
         discography_view.switch_view("list")
+        discography_view.set_content(sample_album_metadata)
         assert discography_view.current_view == "list"
-
-        # Switch to grid view
-        discography_view.switch_view("grid")
-        assert discography_view.current_view == "grid"
-        assert (
-            discography_view.stacked_widget.currentWidget()
-            == discography_view.grid_view
+        assert discography_view.stacked_widget.currentWidget() is (
+            discography_view.list_view
         )
-        assert discography_view.grid_view_btn.isChecked() is True
-        assert discography_view.list_view_btn.isChecked() is False
 
-    def test_switch_to_list_view(self, discography_view: DiscographyView):
-        """Test switching to list view."""
-        # Start with grid view (default)
-        assert discography_view.current_view == "grid"
+        for view_type in VIEW_SWITCH_SEQUENCE:
+            discography_view.switch_view(view_type)
 
-        # Switch to list view
-        discography_view.switch_view("list")
-        assert discography_view.current_view == "list"
-        assert (
-            discography_view.stacked_widget.currentWidget()
-            == discography_view.list_view
-        )
-        assert discography_view.grid_view_btn.isChecked() is False
-        assert discography_view.list_view_btn.isChecked() is True
+            assert discography_view.current_view == view_type
+            assert discography_view.stacked_widget.currentWidget() is views[view_type]
+            assert discography_view.grid_view_btn.isChecked() is (view_type == "grid")
+            assert discography_view.list_view_btn.isChecked() is (view_type == "list")
+            assert len(discography_view.grid_view.items) == 1
+            assert discography_view.list_view.rowCount() == track_count
 
-    def test_view_changed_signal(self, discography_view: DiscographyView, qtbot):
+    def test_view_changed_signal(self, discography_view: DiscographyView, capture):
         """Test view changed signal emission."""
-        with qtbot.waitSignal(discography_view.view_changed, timeout=1000) as blocker:
-            discography_view.switch_view("list")
+        calls = capture(discography_view.view_changed)
+
+        discography_view.switch_view("list")
 
-        assert blocker.args == ["list"]
+        assert calls == [("list",)]
 
-    def test_signal_connections(self, discography_view: DiscographyView, qtbot):
+    def test_signal_connections(self, discography_view: DiscographyView, capture):
         """Test that view signals are properly connected."""
-        # Test grid view signal connection
-        with qtbot.waitSignal(discography_view.item_selected, timeout=1000) as blocker:
-            discography_view.grid_view.item_selected.emit("test_id")
-        assert blocker.args == ["test_id"]
+        selected = capture(discography_view.item_selected)
+        downloads = capture(discography_view.download_requested)
 
+        # Test grid view signal connection
+        discography_view.grid_view.item_selected.emit("test_id")
         # Test list view signal connections
-        with qtbot.waitSignal(discography_view.item_selected, timeout=1000) as blocker:
-            discography_view.list_view.item_selected.emit("test_id_2")
-        assert blocker.args == ["test_id_2"]
-
-        with qtbot.waitSignal(
-            discography_view.download_requested, timeout=1000
-        ) as blocker:
-            discography_view.list_view.download_requested.emit({
-                "id": "download_id",
-                "title": "Test Track",
-                "artist": "Test Artist",
-            })
-        assert blocker.args == [
-            {"id": "download_id", "title": "Test Track", "artist": "Test Artist"}
+        discography_view.list_view.item_selected.emit("test_id_2")
+        discography_view.list_view.download_requested.emit({
+            "id": "download_id",
+            "title": "Test Track",
+            "artist": "Test Artist",
+        })
+
+        assert selected == [("test_id",), ("test_id_2",)]
+        assert downloads == [
+            ({"id": "download_id", "title": "Test Track", "artist": "Test Artist"},)
         ]
 
     def test_set_content_album(
         self, discography_view: DiscographyView, sample_album_metadata
     ):
         """Test setting album content."""
+        expected = len(sample_album_metadata["items"])
+
         discography_view.set_content(sample_album_metadata)
 
         # Should clear existing items and add new ones
         # Check that both views received the content
         assert len(discography_view.grid_view.items) == 1
-        assert discography_view.list_view.rowCount() == len(
-            sample_album_metadata["items"]
-        )
+        assert discography_view.list_view.rowCount() == expected
 
     def test_set_content_track(self, discography_view: DiscographyView):
         """Test setting track content."""
@@ -183,10 +246,12 @@ class TestDiscographyView:
         self, discography_view: DiscographyView, sample_album_metadata
     ):
         """Test clearing items from both views."""
+        expected = len(sample_album_metadata["items"])
+
         # Add some content first
         discography_view.set_content(sample_album_metadata)
         assert len(discography_view.grid_view.items) > 0
-        assert discography_view.list_view.rowCount() > 0
+        assert discography_view.list_view.rowCount() == expected
 
         # Clear items
         discography_view.clear_items()
@@ -235,7 +300,7 @@ class TestDiscographyView:
         assert album_id in discography_view._consumed_artwork_ids
         assert album_id in discography_view.pending_artwork
 
-    def test_sort_items_title(self, discography_view: DiscographyView, qtbot):
+    def test_sort_items_title(self, discography_view: DiscographyView):
         """Test sorting items by title."""
         discography_view.sort_items("title")
 
@@ -265,34 +330,15 @@ class TestDiscographyView:
         assert discography_view.sort_title_btn.isChecked() is False
         assert discography_view.sort_year_btn.isChecked() is False
 
-    @pytest.mark.parametrize("view_type", ["grid", "list"])
-    def test_view_switching_preserves_content(
-        self, discography_view: DiscographyView, sample_album_metadata, view_type
-    ):
-        """Test that switching views preserves content."""
-        # Set content
-        discography_view.set_content(sample_album_metadata)
-
-        # Switch to specified view
-        discography_view.switch_view(view_type)
-
-        # Content should still be there
-        if view_type == "grid":
-            assert len(discography_view.grid_view.items) == 1
-        else:
-            assert discography_view.list_view.rowCount() == len(
-                sample_album_metadata["items"]
-            )
-
-    def test_button_click_handlers(self, discography_view: DiscographyView, qtbot):
+    def test_button_click_handlers(self, discography_view: DiscographyView, capture):
         """Test button click handlers."""
-        # Test grid view button
-        with qtbot.waitSignal(discography_view.view_changed, timeout=1000):
-            discography_view.grid_view_btn.click()
+        calls = capture(discography_view.view_changed)
+
+        # Test grid view button, then list view button
+        discography_view.grid_view_btn.click()
+        discography_view.list_view_btn.click()
 
-        # Test list view button
-        with qtbot.waitSignal(discography_view.view_changed, timeout=1000):
-            discography_view.list_view_btn.click()
+        assert calls == [("grid",), ("list",)]
 
     def test_empty_content_handling(self, discography_view: DiscographyView):
         """Test handling of empty content."""
@@ -307,11 +353,11 @@ class TestDiscographyView:
         assert len(discography_view.grid_view.items) == 0
         assert discography_view.list_view.rowCount() == 0
 
-    def test_invalid_content_handling(self, discography_view: DiscographyView):
+    @pytest.mark.parametrize("payload", [{}, None], ids=["empty", "none"])
+    def test_invalid_content_handling(self, discography_view: DiscographyView, payload):
         """Test handling of invalid content."""
         # Should not crash with invalid content
-        discography_view.set_content({})
-        discography_view.set_content(None)  # type: ignore[invalid-argument-type] # Should handle None gracefully
+        discography_view.set_content(payload)
 
     def test_artwork_cleanup_on_clear(
         self, discography_view: DiscographyView, sample_pixmap
@@ -348,28 +394,6 @@ class TestDiscographyView:
         # Should handle multiple updates gracefully and mark as consumed
         assert first_item_id in discography_view._consumed_artwork_ids
 
-    def test_view_state_persistence(self, discography_view: DiscographyView):
-        """Test that view state is maintained."""
-        # Switch to list view
-        discography_view.switch_view("list")
-        assert discography_view.current_view == "list"
-
-        # Add content
-        sample_content = {
-            "content_type": "album",
-            "items": [
-                {"id": "test", "title": "Test", "artist": "Artist", "type": "Album"}
-            ],
-        }
-        discography_view.set_content(sample_content)
-
-        # Should still be in list view
-        assert discography_view.current_view == "list"
-        assert (
-            discography_view.stacked_widget.currentWidget()
-            == discography_view.list_view
-        )
-
     def test_has_search_ui_elements(self, discography_view: DiscographyView):
         """Search input and a sunken divider should exist in the controls bar."""
         from PyQt6.QtWidgets import QFrame, QLineEdit
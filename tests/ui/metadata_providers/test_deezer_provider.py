@@ -9,18 +9,63 @@ data mapping and control flow. Each test has a single responsibility.
 
 from __future__ import annotations
 
-import asyncio
 from dataclasses import dataclass
-from types import SimpleNamespace
+from types import MappingProxyType, SimpleNamespace
 from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
 
 import pytest
 
 from ripstream.models.enums import ArtistItemFilter
+from ripstream.ui.metadata_providers import deezer as provider_module
 from ripstream.ui.metadata_providers.deezer import DeezerMetadataProvider
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterable, Mapping
+
+
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
+# Canned API responses shared by every test; the SUT only reads them.
+ALBUM_RESP = MappingProxyType({
+    "id": 123,
+    "title": "Test Album",
+    "artist": {"name": "The Artist"},
+    "release_date": "2020-05-01",
+    "nb_tracks": 2,
+    "cover_medium": "http://img/med.jpg",
+})
+ALBUM_TRACKS = (
+    MappingProxyType({
+        "id": 1,
+        "title": "Song A",
+        "artist": {"name": "The Artist"},
+        "duration": 125,
+        "track_position": 1,
+    }),
+    MappingProxyType({
+        "id": 2,
+        "title": "Song B",
+        "artist": {"name": "The Artist"},
+        "duration": 245,
+        "track_position": 2,
+    }),
+)
+TRACK_RESP = MappingProxyType({
+    "id": 42,
+    "title": "My Track",
+    "artist": {"name": "The Artist"},
+    "duration": 61,
+    "track_position": 7,
+    "album": {"title": "An Album", "cover_medium": "http://img/med.jpg"},
+})
+PLAYLIST_RESP = MappingProxyType({
+    "id": 9,
+    "title": "Chill Mix",
+    "creator": {"name": "DJ"},
+    "nb_tracks": 2,
+    "picture_medium": "http://img/med.jpg",
+})
+PLAYLIST_TRACKS = (MappingProxyType({"id": 1}), MappingProxyType({"id": 2}))
 
 
 @runtime_checkable
@@ -31,6 +76,12 @@ class _ClientLike(Protocol):  # pragma: no cover - typing helper
     def get_artist(self, artist_id: str | int) -> Any: ...
 
 
+class DummyClient:
+    """Deezer client double whose API methods are assigned per test."""
+
+    __slots__ = ("get_album", "get_artist", "get_playlist", "get_track")
+
+
 def _make_provider_with_api(
     methods: dict[str, Callable[..., Any]],
 ) -> DeezerMetadataProvider:
@@ -38,121 +89,118 @@ def _make_provider_with_api(
 
     Returns a provider with `_authenticated=True` and `client` set to the dummy.
     """
-    client: _ClientLike = SimpleNamespace(**methods)  # type: ignore[assignment]
+    client: _ClientLike = DummyClient()  # type: ignore[assignment]
+    for name, method in methods.items():
+        setattr(client, name, method)
     provider = DeezerMetadataProvider(credentials={})
     provider.client = client  # type: ignore[assignment]
     provider._authenticated = True
     return provider
 
 
-@pytest.mark.asyncio
-async def test_authenticate_success_with_client(
-    monkeypatch: pytest.MonkeyPatch,
-) -> None:
-    """Authenticate returns True when deezer.Client can be instantiated."""
+@pytest.fixture
+def make_provider() -> Callable[..., DeezerMetadataProvider]:
+    """Return the factory that builds an authenticated provider over a dummy client."""
+    return _make_provider_with_api
 
-    class DummyClient:
-        pass
 
-    import ripstream.ui.metadata_providers.deezer as provider_module
+@dataclass(slots=True)
+class DummyTrack:
+    _data: Mapping[str, Any]
 
-    monkeypatch.setattr(provider_module.deezer, "Client", DummyClient)
+    def as_dict(self) -> Mapping[str, Any]:
+        return self._data
 
-    provider = DeezerMetadataProvider(credentials={"arl": "token"})
-    ok = await provider.authenticate()
-    assert ok is True
-    assert provider.is_authenticated is True
 
+class DummyAlbum:
+    __slots__ = ("_data", "_tracks")
 
-@pytest.mark.asyncio
-async def test_authenticate_failure_when_client_init_raises(
-    monkeypatch: pytest.MonkeyPatch,
-) -> None:
-    """Authenticate returns False when deezer.Client raises at construction."""
+    def __init__(
+        self, data: Mapping[str, Any], tracks: Iterable[Mapping[str, Any]]
+    ) -> None:
+        self._data = data
+        self._tracks = [DummyTrack(t) for t in tracks]
 
-    class DummyClient:
-        def __init__(self) -> None:
-            msg = "boom"
-            raise RuntimeError(msg)
+    def get_tracks(self) -> list[DummyTrack]:
+        return self._tracks
 
-    import ripstream.ui.metadata_providers.deezer as provider_module
+    def as_dict(self) -> Mapping[str, Any]:
+        return self._data
 
-    monkeypatch.setattr(provider_module.deezer, "Client", DummyClient)
 
-    provider = DeezerMetadataProvider(credentials={"arl": "bad"})
-    ok = await provider.authenticate()
-    assert ok is False
-    assert provider.is_authenticated is False
+class DummyPlaylist(DummyAlbum):
+    __slots__ = ()
 
+    @property
+    def title(self) -> str:
+        return self._data["title"]
 
-@pytest.mark.asyncio
-async def test_authenticate_without_arl(monkeypatch: pytest.MonkeyPatch) -> None:
-    """Authenticate returns True without ARL when `deezer.Client` is available."""
 
-    class DummyClient:
-        pass
+@dataclass(slots=True)
+class DummyAlbumId:
+    id: int
 
-    import ripstream.ui.metadata_providers.deezer as provider_module
 
-    monkeypatch.setattr(provider_module.deezer, "Client", DummyClient)
+class DummyArtist:
+    __slots__ = ("_albums", "_data")
 
-    provider = DeezerMetadataProvider(credentials={})
+    def __init__(self, data: dict, album_ids: list[int]) -> None:
+        self._data = data
+        self._albums = [DummyAlbumId(a) for a in album_ids]
+
+    def get_albums(self) -> list[DummyAlbumId]:
+        return self._albums
+
+    def as_dict(self) -> Mapping[str, Any]:
+        return self._data
+
+    @property
+    def name(self) -> str:
+        return self._data["name"]
+
+
+class StubDeezerClient:
+    """Stand-in for `deezer.Client` that constructs successfully."""
+
+
+class FailingDeezerClient:
+    """Stand-in for `deezer.Client` whose construction fails."""
+
+    def __init__(self) -> None:
+        msg = "boom"
+        raise RuntimeError(msg)
+
+
+@pytest.mark.parametrize(
+    ("client_class", "credentials", "expected"),
+    [
+        pytest.param(StubDeezerClient, {"arl": "token"}, True, id="with-arl"),
+        pytest.param(FailingDeezerClient, {"arl": "bad"}, False, id="client-raises"),
+        pytest.param(StubDeezerClient, {}, True, id="without-arl"),
+    ],
+)
+async def test_authenticate(
+    monkeypatch: pytest.MonkeyPatch,
+    client_class: type,
+    credentials: dict[str, str],
+    expected: bool,
+) -> None:
+    """Authenticate reflects whether `deezer.Client` can be instantiated."""
+    monkeypatch.setattr(provider_module.deezer, "Client", client_class)
+
+    provider = DeezerMetadataProvider(credentials=credentials)
     ok = await provider.authenticate()
-    assert ok is True
-    assert provider.is_authenticated is True
+    assert ok is expected
+    assert provider.is_authenticated is expected
 
 
-@pytest.mark.asyncio
-async def test_fetch_album_metadata_builds_ui_data() -> None:
+async def test_fetch_album_metadata_builds_ui_data(
+    make_provider: Callable[..., DeezerMetadataProvider],
+) -> None:
     """Album metadata includes album_info and mapped track items."""
 
-    album_resp = {
-        "id": 123,
-        "title": "Test Album",
-        "artist": {"name": "The Artist"},
-        "release_date": "2020-05-01",
-        "nb_tracks": 2,
-        "cover_medium": "http://img/med.jpg",
-    }
-    tracks_resp = {
-        "data": [
-            {
-                "id": 1,
-                "title": "Song A",
-                "artist": {"name": "The Artist"},
-                "duration": 125,
-                "track_position": 1,
-            },
-            {
-                "id": 2,
-                "title": "Song B",
-                "artist": {"name": "The Artist"},
-                "duration": 245,
-                "track_position": 2,
-            },
-        ]
-    }
-
-    class DummyTrack:
-        def __init__(self, data: dict) -> None:
-            self._data = data
-
-        def as_dict(self) -> dict:
-            return self._data
-
-    class DummyAlbum:
-        def __init__(self, data: dict, tracks: list[dict]) -> None:
-            self._data = data
-            self._tracks = [DummyTrack(t) for t in tracks]
-
-        def get_tracks(self) -> list[DummyTrack]:
-            return self._tracks
-
-        def as_dict(self) -> dict:
-            return self._data
-
-    provider = _make_provider_with_api({
-        "get_album": lambda _album_id: DummyAlbum(album_resp, tracks_resp["data"]),
+    provider = make_provider({
+        "get_album": lambda _album_id: DummyAlbum(ALBUM_RESP, ALBUM_TRACKS),
     })
 
     result = await provider.fetch_album_metadata("123")
@@ -168,29 +216,12 @@ async def test_fetch_album_metadata_builds_ui_data() -> None:
     assert data["items"][0]["duration_formatted"] == "02:05"
 
 
-@pytest.mark.asyncio
-async def test_fetch_track_metadata_builds_ui_item() -> None:
+async def test_fetch_track_metadata_builds_ui_item(
+    make_provider: Callable[..., DeezerMetadataProvider],
+) -> None:
     """Track metadata maps core fields and artwork from album."""
 
-    track_resp = {
-        "id": 42,
-        "title": "My Track",
-        "artist": {"name": "The Artist"},
-        "duration": 61,
-        "track_position": 7,
-        "album": {"title": "An Album", "cover_medium": "http://img/med.jpg"},
-    }
-
-    class DummyTrack:
-        def __init__(self, data: dict) -> None:
-            self._data = data
-
-        def as_dict(self) -> dict:
-            return self._data
-
-    provider = _make_provider_with_api({
-        "get_track": lambda _tid: DummyTrack(track_resp)
-    })
+    provider = make_provider({"get_track": lambda _tid: DummyTrack(TRACK_RESP)})
 
     result = await provider.fetch_track_metadata("42")
     assert result.content_type == "track"
@@ -202,45 +233,13 @@ async def test_fetch_track_metadata_builds_ui_item() -> None:
     assert item["artwork_url"] == "http://img/med.jpg"
 
 
-@pytest.mark.asyncio
-async def test_fetch_playlist_metadata_builds_ui_item() -> None:
+async def test_fetch_playlist_metadata_builds_ui_item(
+    make_provider: Callable[..., DeezerMetadataProvider],
+) -> None:
     """Playlist metadata includes basic info and track count."""
 
-    playlist_resp = {
-        "id": 9,
-        "title": "Chill Mix",
-        "creator": {"name": "DJ"},
-        "nb_tracks": 2,
-        "picture_medium": "http://img/med.jpg",
-    }
-    playlist_tracks_resp = {"data": [{"id": 1}, {"id": 2}]}
-
-    class DummyTrack:
-        def __init__(self, data: dict) -> None:
-            self._data = data
-
-        def as_dict(self) -> dict:
-            return self._data
-
-    class DummyPlaylist:
-        def __init__(self, data: dict, tracks: list[dict]) -> None:
-            self._data = data
-            self._tracks = [DummyTrack(t) for t in tracks]
-
-        def get_tracks(self) -> list[DummyTrack]:
-            return self._tracks
-
-        def as_dict(self) -> dict:
-            return self._data
-
-        @property
-        def title(self) -> str:
-            return self._data["title"]
-
-    provider = _make_provider_with_api({
-        "get_playlist": lambda _pid: DummyPlaylist(
-            playlist_resp, playlist_tracks_resp["data"]
-        ),
+    provider = make_provider({
+        "get_playlist": lambda _pid: DummyPlaylist(PLAYLIST_RESP, PLAYLIST_TRACKS),
     })
 
     result = await provider.fetch_playlist_metadata("9")
@@ -252,38 +251,18 @@ async def test_fetch_playlist_metadata_builds_ui_item() -> None:
     assert item["artwork_url"] == "http://img/med.jpg"
 
 
-@pytest.mark.asyncio
 async def test_fetch_artist_metadata_respects_filter(
     monkeypatch: pytest.MonkeyPatch,
+    make_provider: Callable[..., DeezerMetadataProvider],
 ) -> None:
     """Artist discography is filtered into albums vs singles based on track count."""
 
-    @dataclass(slots=True)
-    class DummyAlbumId:
-        id: int
-
-    class DummyArtist:
-        def __init__(self, data: dict, album_ids: list[int]) -> None:
-            self._data = data
-            self._albums = [DummyAlbumId(a) for a in album_ids]
-
-        def get_albums(self) -> list[DummyAlbumId]:
-            return self._albums
-
-        def as_dict(self) -> dict:
-            return self._data
-
-        @property
-        def name(self) -> str:
-            return self._data["name"]
-
-    provider = _make_provider_with_api({
+    provider = make_provider({
         "get_artist": lambda _aid: DummyArtist({"name": "Artist"}, [100, 200]),
     })
 
     # Patch the per-album fetch to avoid deep mapping and control track counts
-    async def fake_fetch_album_metadata(album_id: str) -> Any:
-        await asyncio.sleep(0)
+    async def fake_fetch_album_metadata(album_id: str) -> Any:  # noqa: RUF029
         count = 2 if str(album_id) == "100" else 5
         return SimpleNamespace(
             data={
@@ -12,6 +12,36 @@ from ripstream.ui.metadata_providers.qobuz import QobuzMetadataProvider
 from ripstream.ui.metadata_providers.youtube import YouTubeMetadataProvider
 
 
+class _CustomSpotifyProvider(BaseMetadataProvider):
+    """Minimal provider registered for SPOTIFY by the registration test."""
+
+    @property
+    def service_name(self) -> str:
+        return "Custom"
+
+    @property
+    def streaming_source(self) -> StreamingSource:
+        return StreamingSource.SPOTIFY
+
+    async def authenticate(self) -> bool:
+        return True
+
+    async def fetch_artist_metadata(self, artist_id: str):
+        raise NotImplementedError
+
+    async def fetch_album_metadata(self, album_id: str):
+        raise NotImplementedError
+
+    async def fetch_track_metadata(self, track_id: str):
+        raise NotImplementedError
+
+    async def fetch_playlist_metadata(self, playlist_id: str):
+        raise NotImplementedError
+
+    async def cleanup(self) -> None:
+        pass
+
+
 class TestMetadataProviderFactory:
     """Test cases for MetadataProviderFactory."""
 
@@ -38,6 +68,7 @@ class TestMetadataProviderFactory:
             StreamingSource.DEEZER,
             StreamingSource.TIDAL,
             StreamingSource.SPOTIFY,
+            StreamingSource.APPLE_MUSIC,
         ],
     )
     def test_create_unsupported_provider(self, streaming_source):
@@ -53,11 +84,6 @@ class TestMetadataProviderFactory:
         )
         assert provider.credentials == credentials
 
-    def test_unsupported_service(self):
-        """Test creating provider for unsupported service."""
-        with pytest.raises(ValueError, match="Unsupported streaming service"):
-            MetadataProviderFactory.create_provider(StreamingSource.SPOTIFY)
-
     def test_get_supported_services(self):
         """Test getting list of supported services."""
         services = MetadataProviderFactory.get_supported_services()
@@ -84,39 +110,17 @@ class TestMetadataProviderFactory:
             == expected_supported
         )
 
-    def test_register_provider(self):
+    def test_register_provider(self, monkeypatch):
         """Test registering a new provider."""
-
-        class CustomProvider(BaseMetadataProvider):
-            @property
-            def service_name(self) -> str:
-                return "Custom"
-
-            @property
-            def streaming_source(self) -> StreamingSource:
-                return StreamingSource.SPOTIFY
-
-            async def authenticate(self) -> bool:
-                return True
-
-            async def fetch_artist_metadata(self, artist_id: str):
-                raise NotImplementedError
-
-            async def fetch_album_metadata(self, album_id: str):
-                raise NotImplementedError
-
-            async def fetch_track_metadata(self, track_id: str):
-                raise NotImplementedError
-
-            async def fetch_playlist_metadata(self, playlist_id: str):
-                raise NotImplementedError
-
-            async def cleanup(self) -> None:
-                pass
-
-        # Register the custom provider
+        # Register into a private copy of the class-level registry, restored
+        # by monkeypatch so SPOTIFY stays unsupported for every other test
+        monkeypatch.setattr(
+            MetadataProviderFactory,
+            "_providers",
+            dict(MetadataProviderFactory._providers),
+        )
         MetadataProviderFactory.register_provider(
-            StreamingSource.SPOTIFY, CustomProvider
+            StreamingSource.SPOTIFY, _CustomSpotifyProvider
         )
 
         # Test that it's now supported
@@ -124,7 +128,7 @@ class TestMetadataProviderFactory:
 
         # Test creating the custom provider
         provider = MetadataProviderFactory.create_provider(StreamingSource.SPOTIFY)
-        assert isinstance(provider, CustomProvider)
+        assert isinstance(provider, _CustomSpotifyProvider)
 
     def test_register_invalid_provider(self):
         """Test registering an invalid provider class."""
@@ -3,6 +3,10 @@
 
 """Tests for artist countdown functionality in QobuzMetadataProvider."""
 
+import inspect
+from collections.abc import Callable, Coroutine
+from types import SimpleNamespace
+from typing import Any
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
@@ -10,10 +14,41 @@ import pytest
 from ripstream.ui.metadata_providers.qobuz import QobuzMetadataProvider
 
 
+def _aret(value: Any) -> Callable[..., Coroutine[Any, Any, Any]]:
+    """Return a coroutine function that resolves to ``value``.
+
+    Lighter than ``AsyncMock`` for stubs whose calls are never asserted.
+    """
+
+    async def _stub(*_args: Any, **_kwargs: Any) -> Any:  # noqa: RUF029
+        return value
+
+    return _stub
+
+
+# Covers tree shared by every mocked artist; tests only read from it
+ARTIST_THUMBNAIL = SimpleNamespace(url="https://example.com/thumbnail.jpg")
+ARTIST_COVERS = SimpleNamespace(get_best_image=lambda _sizes: ARTIST_THUMBNAIL)
+
+# Album counts paired with the expected total and remaining item counts
+ALBUM_COUNT_CASES = (
+    (0, 0, 0),
+    (1, 1, 1),
+    (3, 3, 3),
+    (10, 10, 10),
+    (100, 100, 100),
+)
+
+# Album IDs for the largest case; smaller cases take a prefix
+ALBUM_IDS = tuple(
+    f"album_{i}" for i in range(max(count for count, _, _ in ALBUM_COUNT_CASES))
+)
+
+
 class TestQobuzMetadataProviderArtistCountdown:
     """Test the artist countdown functionality in QobuzMetadataProvider."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_credentials(self):
         """Mock credentials for testing."""
         return {"username": "test", "password": "test"}
@@ -23,29 +58,26 @@ class TestQobuzMetadataProviderArtistCountdown:
         """Create QobuzMetadataProvider instance."""
         return QobuzMetadataProvider(mock_credentials)
 
-    @pytest.fixture
-    def mock_qobuz_downloader(self):
-        """Mock QobuzDownloader."""
-        downloader = Mock()
-        downloader.get_artist_metadata = AsyncMock()
-        return downloader
+    @pytest.fixture(scope="module")
+    def qobuz_downloader_template(self):
+        """Build the QobuzDownloader mock once per module."""
+        return Mock()
 
     @pytest.fixture
+    def mock_qobuz_downloader(self, qobuz_downloader_template):
+        """Mock QobuzDownloader, reset to a clean state for each test."""
+        qobuz_downloader_template.reset_mock(return_value=True, side_effect=True)
+        return qobuz_downloader_template
+
+    @pytest.fixture(scope="module")
     def mock_artist_model(self):
         """Mock artist model with album IDs."""
-        artist = Mock()
-        artist.name = "Test Artist"
-        artist.info.biography = "Test biography"
-        artist.album_ids = ["album_1", "album_2", "album_3", "album_4", "album_5"]
-
-        # Mock covers
-        covers = Mock()
-        thumbnail = Mock()
-        thumbnail.url = "https://example.com/thumbnail.jpg"
-        covers.get_best_image.return_value = thumbnail
-        artist.covers = covers
-
-        return artist
+        return SimpleNamespace(
+            name="Test Artist",
+            info=SimpleNamespace(biography="Test biography"),
+            album_ids=["album_1", "album_2", "album_3", "album_4", "album_5"],
+            covers=ARTIST_COVERS,
+        )
 
     @pytest.fixture
     def authenticated_provider(self, qobuz_provider, mock_qobuz_downloader):
@@ -54,10 +86,22 @@ class TestQobuzMetadataProviderArtistCountdown:
         qobuz_provider.qobuz_downloader = mock_qobuz_downloader
         return qobuz_provider
 
+    @pytest.fixture(scope="module")
+    def fetch_albums_template(self):
+        """Build the _fetch_albums_async mock once per module."""
+        return AsyncMock()
+
+    @pytest.fixture
+    def patched_fetch_albums(self, authenticated_provider, fetch_albums_template):
+        """Patch _fetch_albums_async on the provider with a freshly reset mock."""
+        fetch_albums_template.reset_mock(return_value=True, side_effect=True)
+        with patch.object(
+            authenticated_provider, "_fetch_albums_async", fetch_albums_template
+        ):
+            yield fetch_albums_template
+
     def test_fetch_artist_metadata_streaming_signature(self, authenticated_provider):
         """Test that fetch_artist_metadata_streaming has the correct signature."""
-        import inspect
-
         sig = inspect.signature(authenticated_provider.fetch_artist_metadata_streaming)
         params = list(sig.parameters.keys())
 
@@ -67,84 +111,50 @@ class TestQobuzMetadataProviderArtistCountdown:
         assert params[1] == "album_callback"
         assert params[2] == "counter_init_callback"
 
+    @pytest.mark.parametrize(
+        ("use_counter", "use_album"),
+        [(True, True), (False, True), (True, False)],
+        ids=["both_callbacks", "without_counter", "without_album"],
+    )
     @pytest.mark.asyncio
-    async def test_fetch_artist_metadata_streaming_with_counter_callback(
-        self, authenticated_provider, mock_qobuz_downloader, mock_artist_model
+    async def test_fetch_artist_metadata_streaming_callbacks(
+        self,
+        authenticated_provider,
+        mock_qobuz_downloader,
+        mock_artist_model,
+        patched_fetch_albums,
+        use_counter,
+        use_album,
     ):
-        """Test fetch_artist_metadata_streaming calls counter_init_callback."""
+        """Test fetch_artist_metadata_streaming with and without each callback."""
         # Setup mock
-        mock_qobuz_downloader.get_artist_metadata.return_value = mock_artist_model
+        mock_qobuz_downloader.get_artist_metadata = _aret(mock_artist_model)
 
         # Mock callbacks
-        album_callback = Mock()
-        counter_init_callback = Mock()
-
-        # Mock _fetch_albums_async to avoid actual album fetching
-        with patch.object(
-            authenticated_provider, "_fetch_albums_async", new_callable=AsyncMock
-        ) as mock_fetch_albums:
-            # Call the method
-            await authenticated_provider.fetch_artist_metadata_streaming(
-                "artist_123",
-                album_callback=album_callback,
-                counter_init_callback=counter_init_callback,
-            )
-
-            # Verify counter_init_callback was called with correct parameters
-            counter_init_callback.assert_called_once_with(
-                5, "Qobuz"
-            )  # 5 albums, Qobuz service
-
-            # Verify _fetch_albums_async was called
-            mock_fetch_albums.assert_called_once_with(
-                mock_artist_model.album_ids, album_callback
-            )
+        counter_init_callback = Mock() if use_counter else None
+        album_callback = Mock() if use_album else None
 
-    @pytest.mark.asyncio
-    async def test_fetch_artist_metadata_streaming_without_counter_callback(
-        self, authenticated_provider, mock_qobuz_downloader, mock_artist_model
-    ):
-        """Test fetch_artist_metadata_streaming works without counter_init_callback."""
-        # Setup mock
-        mock_qobuz_downloader.get_artist_metadata.return_value = mock_artist_model
-
-        # Mock album callback only
-        album_callback = Mock()
-
-        # Mock _fetch_albums_async
-        with patch.object(
-            authenticated_provider, "_fetch_albums_async", new_callable=AsyncMock
-        ) as mock_fetch_albums:
-            # Call the method without counter callback
-            await authenticated_provider.fetch_artist_metadata_streaming(
-                "artist_123", album_callback=album_callback, counter_init_callback=None
-            )
-
-            # Verify _fetch_albums_async was still called
-            mock_fetch_albums.assert_called_once_with(
-                mock_artist_model.album_ids, album_callback
-            )
-
-    @pytest.mark.asyncio
-    async def test_fetch_artist_metadata_streaming_without_album_callback(
-        self, authenticated_provider, mock_qobuz_downloader, mock_artist_model
-    ):
-        """Test fetch_artist_metadata_streaming works without album_callback."""
-        # Setup mock
-        mock_qobuz_downloader.get_artist_metadata.return_value = mock_artist_model
-
-        # Mock counter callback only
-        counter_init_callback = Mock()
-
-        # Call the method without album callback
+        # Call the method
         await authenticated_provider.fetch_artist_metadata_streaming(
             "artist_123",
-            album_callback=None,
+            album_callback=album_callback,
             counter_init_callback=counter_init_callback,
         )
 
-        # Verify counter callback was not called (no album fetching)
-        counter_init_callback.assert_not_called()
+        if not use_album:
+            # Without an album callback there is no album fetching to count
+            counter_init_callback.assert_not_called()
+            patched_fetch_albums.assert_not_called()
+            return
+
+        if use_counter:
+            # 5 albums, Qobuz service
+            counter_init_callback.assert_called_once_with(5, "Qobuz")
+
+        # Verify _fetch_albums_async was called
+        patched_fetch_albums.assert_called_once_with(
+            mock_artist_model.album_ids, album_callback
+        )
 
     @pytest.mark.asyncio
     async def test_fetch_artist_metadata_streaming_result_includes_remaining_items(
@@ -152,7 +162,7 @@ class TestQobuzMetadataProviderArtistCountdown:
     ):
         """Test that result includes remaining_items field."""
         # Setup mock
-        mock_qobuz_downloader.get_artist_metadata.return_value = mock_artist_model
+        mock_qobuz_downloader.get_artist_metadata = _aret(mock_artist_model)
 
         # Call the method
         result = await authenticated_provider.fetch_artist_metadata_streaming(
@@ -175,7 +185,7 @@ class TestQobuzMetadataProviderArtistCountdown:
     ):
         """Test that result includes album_ids field."""
         # Setup mock
-        mock_qobuz_downloader.get_artist_metadata.return_value = mock_artist_model
+        mock_qobuz_downloader.get_artist_metadata = _aret(mock_artist_model)
 
         # Call the method
         result = await authenticated_provider.fetch_artist_metadata_streaming(
@@ -192,49 +202,27 @@ class TestQobuzMetadataProviderArtistCountdown:
             "album_5",
         ]
 
-    @pytest.mark.parametrize(
-        ("album_count", "expected_total", "expected_remaining"),
-        [
-            (0, 0, 0),
-            (1, 1, 1),
-            (3, 3, 3),
-            (10, 10, 10),
-            (100, 100, 100),
-        ],
-    )
     @pytest.mark.asyncio
+    @pytest.mark.usefixtures("patched_fetch_albums")
     async def test_fetch_artist_metadata_streaming_various_album_counts(
-        self,
-        authenticated_provider,
-        mock_qobuz_downloader,
-        album_count,
-        expected_total,
-        expected_remaining,
+        self, authenticated_provider, mock_qobuz_downloader
     ):
         """Test fetch_artist_metadata_streaming with various album counts."""
-        # Create mock artist with specific album count
-        artist = Mock()
-        artist.name = "Test Artist"
-        artist.info.biography = "Test biography"
-        artist.album_ids = [f"album_{i}" for i in range(album_count)]
-
-        # Mock covers
-        covers = Mock()
-        thumbnail = Mock()
-        thumbnail.url = "https://example.com/thumbnail.jpg"
-        covers.get_best_image.return_value = thumbnail
-        artist.covers = covers
-
-        mock_qobuz_downloader.get_artist_metadata.return_value = artist
-
-        # Mock counter callback
+        # One mock artist whose album IDs are swapped per case
+        artist = SimpleNamespace(
+            name="Test Artist",
+            info=SimpleNamespace(biography="Test biography"),
+            album_ids=[],
+            covers=ARTIST_COVERS,
+        )
+        mock_qobuz_downloader.get_artist_metadata = _aret(artist)
+
         counter_init_callback = Mock()
 
-        # Mock _fetch_albums_async
-        with patch.object(
-            authenticated_provider, "_fetch_albums_async", new_callable=AsyncMock
-        ):
-            # Call the method
+        for album_count, expected_total, expected_remaining in ALBUM_COUNT_CASES:
+            artist.album_ids = list(ALBUM_IDS[:album_count])
+            counter_init_callback.reset_mock()
+
             result = await authenticated_provider.fetch_artist_metadata_streaming(
                 "artist_123",
                 album_callback=Mock(),
@@ -243,22 +231,23 @@ class TestQobuzMetadataProviderArtistCountdown:
 
             # Verify counts
             artist_info = result.data["artist_info"]
-            assert artist_info["total_items"] == expected_total
-            assert artist_info["remaining_items"] == expected_remaining
+            assert artist_info["total_items"] == expected_total, album_count
+            assert artist_info["remaining_items"] == expected_remaining, album_count
 
             # Verify counter callback was called with correct count
-            if album_count > 0:
-                counter_init_callback.assert_called_once_with(album_count, "Qobuz")
-            else:
-                counter_init_callback.assert_called_once_with(0, "Qobuz")
+            counter_init_callback.assert_called_once_with(album_count, "Qobuz")
 
     @pytest.mark.asyncio
     async def test_fetch_artist_metadata_streaming_counter_callback_timing(
-        self, authenticated_provider, mock_qobuz_downloader, mock_artist_model
+        self,
+        authenticated_provider,
+        mock_qobuz_downloader,
+        mock_artist_model,
+        patched_fetch_albums,
     ):
         """Test that counter_init_callback is called before _fetch_albums_async."""
         # Setup mock
-        mock_qobuz_downloader.get_artist_metadata.return_value = mock_artist_model
+        mock_qobuz_downloader.get_artist_metadata = _aret(mock_artist_model)
 
         # Track call order
         call_order = []
@@ -271,24 +260,19 @@ class TestQobuzMetadataProviderArtistCountdown:
 
         counter_init_callback = Mock(side_effect=track_counter_init)
         album_callback = Mock()
+        patched_fetch_albums.side_effect = track_fetch_albums
 
-        # Mock _fetch_albums_async
-        with patch.object(
-            authenticated_provider,
-            "_fetch_albums_async",
-            side_effect=track_fetch_albums,
-        ):
-            # Call the method
-            await authenticated_provider.fetch_artist_metadata_streaming(
-                "artist_123",
-                album_callback=album_callback,
-                counter_init_callback=counter_init_callback,
-            )
+        # Call the method
+        await authenticated_provider.fetch_artist_metadata_streaming(
+            "artist_123",
+            album_callback=album_callback,
+            counter_init_callback=counter_init_callback,
+        )
 
-            # Verify call order
-            assert len(call_order) == 2
-            assert call_order[0] == "counter_init(5, Qobuz)"
-            assert call_order[1] == "fetch_albums(5 albums)"
+        # Verify call order
+        assert len(call_order) == 2
+        assert call_order[0] == "counter_init(5, Qobuz)"
+        assert call_order[1] == "fetch_albums(5 albums)"
 
     @pytest.mark.asyncio
     async def test_fetch_artist_metadata_streaming_error_handling(
@@ -296,7 +280,9 @@ class TestQobuzMetadataProviderArtistCountdown:
     ):
         """Test error handling in fetch_artist_metadata_streaming."""
         # Setup mock to raise exception
-        mock_qobuz_downloader.get_artist_metadata.side_effect = Exception("API Error")
+        mock_qobuz_downloader.get_artist_metadata = AsyncMock(
+            side_effect=Exception("API Error")
+        )
 
         # Call should raise the exception
         with pytest.raises(Exception, match="API Error"):
@@ -326,12 +312,13 @@ class TestQobuzMetadataProviderArtistCountdown:
             await qobuz_provider.fetch_artist_metadata_streaming("artist_123")
 
     @pytest.mark.asyncio
+    @pytest.mark.usefixtures("patched_fetch_albums")
     async def test_fetch_artist_metadata_streaming_callback_exception_handling(
         self, authenticated_provider, mock_qobuz_downloader, mock_artist_model
     ):
         """Test that exceptions in callbacks don't break the main flow."""
         # Setup mock
-        mock_qobuz_downloader.get_artist_metadata.return_value = mock_artist_model
+        mock_qobuz_downloader.get_artist_metadata = _aret(mock_artist_model)
 
         # Create callback that raises exception
         def failing_counter_callback(total, service):
@@ -340,14 +327,8 @@ class TestQobuzMetadataProviderArtistCountdown:
 
         album_callback = Mock()
 
-        # Mock _fetch_albums_async
-        with (
-            patch.object(
-                authenticated_provider, "_fetch_albums_async", new_callable=AsyncMock
-            ),
-            pytest.raises(ValueError, match="Callback failed"),
-        ):
-            # Call should not raise exception despite callback failure
+        # Call should not raise exception despite callback failure
+        with pytest.raises(ValueError, match="Callback failed"):
             await authenticated_provider.fetch_artist_metadata_streaming(
                 "artist_123",
                 album_callback=album_callback,
@@ -356,11 +337,15 @@ class TestQobuzMetadataProviderArtistCountdown:
 
     @pytest.mark.asyncio
     async def test_fetch_artist_metadata_streaming_integration_flow(
-        self, authenticated_provider, mock_qobuz_downloader, mock_artist_model
+        self,
+        authenticated_provider,
+        mock_qobuz_downloader,
+        mock_artist_model,
+        patched_fetch_albums,
     ):
         """Test the complete integration flow of fetch_artist_metadata_streaming."""
         # Setup mock
-        mock_qobuz_downloader.get_artist_metadata.return_value = mock_artist_model
+        mock_qobuz_downloader.get_artist_metadata = _aret(mock_artist_model)
 
         # Track all interactions
         counter_calls = []
@@ -369,37 +354,38 @@ class TestQobuzMetadataProviderArtistCountdown:
         def track_counter(total, service):
             counter_calls.append((total, service))
 
-        def track_album(album_metadata):
-            album_calls.append(album_metadata)
+        def track_albums(albums_metadata):
+            album_calls.extend(albums_metadata)
 
         counter_callback = Mock(side_effect=track_counter)
-        album_callback = Mock(side_effect=track_album)
+        album_callback = Mock(side_effect=track_albums)
 
-        # Mock _fetch_albums_async to simulate album fetching
+        # Mock _fetch_albums_async to simulate album fetching in one batch
         def mock_fetch_albums(album_ids, callback):
-            for album_id in album_ids:
-                callback({"id": album_id, "title": f"Album {album_id}"})
+            callback([
+                {"id": album_id, "title": f"Album {album_id}"} for album_id in album_ids
+            ])
 
-        with patch.object(
-            authenticated_provider, "_fetch_albums_async", side_effect=mock_fetch_albums
-        ):
-            # Call the method
-            result = await authenticated_provider.fetch_artist_metadata_streaming(
-                "artist_123",
-                album_callback=album_callback,
-                counter_init_callback=counter_callback,
-            )
+        patched_fetch_albums.side_effect = mock_fetch_albums
 
-            # Verify counter was initialized
-            assert len(counter_calls) == 1
-            assert counter_calls[0] == (5, "Qobuz")
+        # Call the method
+        result = await authenticated_provider.fetch_artist_metadata_streaming(
+            "artist_123",
+            album_callback=album_callback,
+            counter_init_callback=counter_callback,
+        )
 
-            # Verify albums were processed
-            assert len(album_calls) == 5
-            for i, call in enumerate(album_calls):
-                assert call["id"] == f"album_{i + 1}"
+        # Verify counter was initialized
+        assert len(counter_calls) == 1
+        assert counter_calls[0] == (5, "Qobuz")
 
-            # Verify result structure
-            assert result.content_type == "artist"
-            assert result.data["artist_info"]["total_items"] == 5
-            assert result.data["artist_info"]["remaining_items"] == 5
+        # Verify albums were processed
+        album_callback.assert_called_once()
+        assert len(album_calls) == 5
+        for i, call in enumerate(album_calls):
+            assert call["id"] == f"album_{i + 1}"
+
+        # Verify result structure
+        assert result.content_type == "artist"
+        assert result.data["artist_info"]["total_items"] == 5
+        assert result.data["artist_info"]["remaining_items"] == 5
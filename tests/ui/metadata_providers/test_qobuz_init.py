@@ -0,0 +1,93 @@
+# Copyright (c) 2025 ripstream and contributors. All rights reserved.
+# Licensed under the MIT license. See LICENSE file in the project root for details.
+
+"""Tests for QobuzMetadataProvider initialization and properties."""
+
+from typing import Any
+from unittest.mock import Mock, patch
+
+import pytest
+
+from ripstream.downloader.config import DownloaderConfig
+from ripstream.downloader.progress import ProgressTracker
+from ripstream.downloader.session import SessionManager
+from ripstream.models.enums import StreamingSource
+from ripstream.ui.metadata_providers.qobuz import QobuzMetadataProvider
+
+SAMPLE_CREDENTIALS: dict[str, Any] = {"username": "test_user", "password": "test_pass"}
+
+QOBUZ_MODULE = "ripstream.ui.metadata_providers.qobuz"
+
+
+def _make_provider(**init_kwargs: Any) -> QobuzMetadataProvider:
+    """Create a provider whose downloader components are spec'd mocks."""
+    with (
+        patch(
+            f"{QOBUZ_MODULE}.DownloaderConfig",
+            return_value=Mock(spec=DownloaderConfig),
+        ),
+        patch(f"{QOBUZ_MODULE}.SessionManager", return_value=Mock(spec=SessionManager)),
+        patch(
+            f"{QOBUZ_MODULE}.ProgressTracker", return_value=Mock(spec=ProgressTracker)
+        ),
+    ):
+        return QobuzMetadataProvider(**init_kwargs)
+
+
+@pytest.fixture(scope="module")
+def provider_without_credentials() -> QobuzMetadataProvider:
+    """Create provider without credentials, shared by read-only tests."""
+    return _make_provider()
+
+
+@pytest.mark.parametrize(
+    ("init_kwargs", "expected_credentials"),
+    [
+        pytest.param(
+            {"credentials": SAMPLE_CREDENTIALS},
+            SAMPLE_CREDENTIALS,
+            id="with-credentials",
+        ),
+        pytest.param({}, {}, id="without-credentials"),
+        pytest.param({"credentials": None}, {}, id="none-credentials"),
+    ],
+)
+def test_init_credential_variants(
+    init_kwargs: dict[str, Any], expected_credentials: dict[str, Any]
+):
+    """Test initialization with, without and with None credentials."""
+    provider = _make_provider(**init_kwargs)
+
+    assert provider.credentials == expected_credentials
+    assert not provider._authenticated
+    assert provider.qobuz_downloader is None
+
+
+def test_init_constructs_real_dependencies():
+    """Test initialization builds real downloader components."""
+    provider = QobuzMetadataProvider(credentials=SAMPLE_CREDENTIALS)
+
+    assert isinstance(provider.download_config, DownloaderConfig)
+    assert isinstance(provider.session_manager, SessionManager)
+    assert isinstance(provider.progress_tracker, ProgressTracker)
+
+
+def test_service_name_property(provider_without_credentials: QobuzMetadataProvider):
+    """Test service_name property."""
+    assert provider_without_credentials.service_name == "Qobuz"
+
+
+def test_streaming_source_property(
+    provider_without_credentials: QobuzMetadataProvider,
+):
+    """Test streaming_source property."""
+    assert provider_without_credentials.streaming_source == StreamingSource.QOBUZ
+
+
+def test_is_authenticated_property():
+    """Test is_authenticated property."""
+    provider = _make_provider()
+    assert not provider.is_authenticated
+
+    provider._authenticated = True
+    assert provider.is_authenticated
@@ -5,7 +5,8 @@
 
 from __future__ import annotations
 
-import asyncio
+from collections import defaultdict
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
@@ -15,29 +16,23 @@ from ripstream.ui.metadata_providers.base import MetadataResult
 from ripstream.ui.metadata_providers.qobuz import QobuzMetadataProvider
 
 
-def _make_mock_artist(album_ids: list[str], raw_items: list[dict]) -> Mock:
-    """Create a minimal mock artist model with required attributes."""
-    artist = Mock()
-    artist.album_ids = album_ids
-    artist.name = "Test Artist"
-    artist.info.biography = "Bio"
-
-    # Covers
-    covers = Mock()
-    thumbnail = Mock()
-    thumbnail.url = "https://example.com/thumb.jpg"
-    covers.get_best_image.return_value = thumbnail
-    artist.covers = covers
-
-    # Stats raw metadata with albums_items
-    stats = Mock()
-    stats.get_metadata.return_value = {"albums_items": raw_items}
-    artist.stats = stats
-    return artist
+def _make_mock_artist(album_ids: list[str], raw_items: list[dict]) -> SimpleNamespace:
+    """Create a minimal artist stand-in with the attributes the provider reads."""
+    thumbnail = SimpleNamespace(url="https://example.com/thumb.jpg")
+    return SimpleNamespace(
+        album_ids=album_ids,
+        name="Test Artist",
+        info=SimpleNamespace(biography="Bio"),
+        covers=SimpleNamespace(get_best_image=lambda _sizes: thumbnail),
+        # Stats raw metadata with albums_items
+        stats=SimpleNamespace(
+            get_metadata=lambda _key, _default=None: {"albums_items": raw_items}
+        ),
+    )
 
 
-def _metadata_result_for_album(album_id: str, num_tracks: int) -> MetadataResult:
-    """Build a full album MetadataResult with the given number of tracks."""
+def _album_data(album_id: str, num_tracks: int) -> dict:
+    """Build full album data with the given number of tracks."""
     tracks = [
         {
             "id": f"{album_id}_track_{i + 1}",
@@ -55,28 +50,42 @@ def _metadata_result_for_album(album_id: str, num_tracks: int) -> MetadataResult
         for i in range(num_tracks)
     ]
 
-    return MetadataResult(
-        content_type="album",
-        service="Qobuz",
-        data={
-            "content_type": "album",
+    return {
+        "content_type": "album",
+        "id": album_id,
+        "album_info": {
             "id": album_id,
-            "album_info": {
-                "id": album_id,
-                "title": f"Album {album_id}",
-                "artist": "Test Artist",
-                "year": 2024,
-                "total_tracks": num_tracks,
-                "total_duration": "10:00",
-                "hires": False,
-                "is_explicit": False,
-                "quality": "FLAC",
-                "artwork_thumbnail": None,
-                "track_count": num_tracks,
-            },
-            "items": tracks,
-            "service": "qobuz",
+            "title": f"Album {album_id}",
+            "artist": "Test Artist",
+            "year": 2024,
+            "total_tracks": num_tracks,
+            "total_duration": "10:00",
+            "hires": False,
+            "is_explicit": False,
+            "quality": "FLAC",
+            "artwork_thumbnail": None,
+            "track_count": num_tracks,
         },
+        "items": tracks,
+        "service": "qobuz",
+    }
+
+
+# Album data is only read by the provider, so each (album_id, num_tracks)
+# pair is built once and shared across the parametrized runs
+_ALBUM_DATA_CACHE: dict[tuple[str, int], dict] = {
+    (album_id, 3): _album_data(album_id, 3) for album_id in ("a1", "a2")
+}
+
+
+def _metadata_result_for_album(album_id: str, num_tracks: int) -> MetadataResult:
+    """Build a full album MetadataResult with the given number of tracks."""
+    key = (album_id, num_tracks)
+    if key not in _ALBUM_DATA_CACHE:
+        _ALBUM_DATA_CACHE[key] = _album_data(album_id, num_tracks)
+
+    return MetadataResult(
+        content_type="album", service="Qobuz", data=_ALBUM_DATA_CACHE[key]
     )
 
 
@@ -120,9 +129,7 @@ async def test_lightweight_then_full_emission(
     provider.qobuz_downloader.get_artist_metadata = AsyncMock(return_value=artist)
 
     # Mock full album fetches
-    async def _fetch_album(album_id: str) -> MetadataResult:  # type: ignore[override]
-        # Yield control to satisfy async usage requirement
-        await asyncio.sleep(0)
+    async def _fetch_album(album_id: str) -> MetadataResult:  # noqa: RUF029
         return _metadata_result_for_album(album_id, 3)
 
     with patch.object(provider, "fetch_album_metadata", side_effect=_fetch_album):
@@ -141,8 +148,6 @@ async def test_lightweight_then_full_emission(
         # We expect for each expected id: two emissions: lightweight then full
         # Keep order assertions by grouping below
         # Group by id
-        from collections import defaultdict
-
         grouped: dict[str, list[dict]] = defaultdict(list)
         for d in emitted:
             album_id_key = d.get("album_info", {}).get("id") or d.get("id")
@@ -5,6 +5,8 @@
 
 import asyncio
 import threading
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
@@ -13,10 +15,41 @@ from ripstream.core.url_parser import ParsedURL
 from ripstream.downloader.enums import ContentType
 from ripstream.models.enums import StreamingSource
 from ripstream.ui.metadata_fetcher import MetadataFetcher
-from ripstream.ui.metadata_providers.qobuz import QobuzMetadataProvider
 from ripstream.ui.metadata_service import MetadataService
 
 
+class MockSignal:
+    """Stand-in for a Qt signal that calls its slots synchronously."""
+
+    __slots__ = ("_single_slot", "_slots")
+
+    def __init__(self):
+        self._slots = ()
+        self._single_slot = None
+
+    def connect(self, slot):
+        """Connect a slot, keeping a direct reference when it is the only one."""
+        self._slots = (*self._slots, slot)
+        self._single_slot = slot if len(self._slots) == 1 else None
+
+    def emit(self, *args):
+        """Call every connected slot with the emitted arguments."""
+        if self._single_slot is not None:
+            self._single_slot(*args)
+            return
+        for slot in self._slots:
+            slot(*args)
+
+
+class FakeProvider:
+    """Metadata provider stand-in exposing what MetadataFetcher uses."""
+
+    def __init__(self):
+        self.service_name = "Qobuz"
+        self.authenticate = AsyncMock(return_value=True)
+        self.cleanup = AsyncMock()
+
+
 class TestArtistCountdownIntegration:
     """Integration tests for the complete artist countdown flow."""
 
@@ -39,19 +72,13 @@ class TestArtistCountdownIntegration:
     @pytest.fixture
     def mock_artist_model(self):
         """Mock artist model with multiple albums."""
-        artist = Mock()
-        artist.name = "Integration Test Artist"
-        artist.info.biography = "Test biography for integration"
-        artist.album_ids = [f"album_{i}" for i in range(1, 6)]  # 5 albums
-
-        # Mock covers
-        covers = Mock()
-        thumbnail = Mock()
-        thumbnail.url = "https://example.com/integration_thumbnail.jpg"
-        covers.get_best_image.return_value = thumbnail
-        artist.covers = covers
-
-        return artist
+        thumbnail = SimpleNamespace(url="https://example.com/integration_thumbnail.jpg")
+        return SimpleNamespace(
+            name="Integration Test Artist",
+            info=SimpleNamespace(biography="Test biography for integration"),
+            album_ids=[f"album_{i}" for i in range(1, 6)],  # 5 albums
+            covers=SimpleNamespace(get_best_image=lambda _sizes: thumbnail),
+        )
 
     @pytest.fixture
     def mock_album_metadata_generator(self):
@@ -74,7 +101,6 @@ class TestArtistCountdownIntegration:
 
         return generate_album_metadata
 
-    @pytest.mark.asyncio
     async def test_complete_artist_countdown_flow(
         self,
         artist_parsed_url,
@@ -85,30 +111,27 @@ class TestArtistCountdownIntegration:
         """Test the complete flow from MetadataFetcher through to progress updates."""
         # Track all progress emissions
         progress_emissions = []
-        album_emissions = []
+        album_batches = []
 
         def track_progress(remaining, total, service):
             progress_emissions.append((remaining, total, service))
 
-        def track_album(album_metadata):
-            album_emissions.append(album_metadata)
+        def track_albums(albums):
+            album_batches.append(albums)
 
         # Create MetadataFetcher
         fetcher = MetadataFetcher(artist_parsed_url, mock_credentials)
 
         # Connect signals
         fetcher.artist_progress_updated.connect(track_progress)
-        fetcher.album_fetched.connect(track_album)
+        fetcher.albums_fetched_batch.connect(track_albums)
 
         # Mock the provider creation and authentication
         with patch(
             "ripstream.ui.metadata_fetcher.MetadataProviderFactory"
         ) as mock_factory:
-            # Create mock provider
-            mock_provider = Mock(spec=QobuzMetadataProvider)
-            mock_provider.service_name = "Qobuz"
-            mock_provider.authenticate = AsyncMock(return_value=True)
-            mock_provider.cleanup = AsyncMock()
+            # Create fake provider
+            mock_provider = FakeProvider()
 
             # Mock the streaming method
             async def mock_fetch_artist_streaming(
@@ -123,8 +146,8 @@ class TestArtistCountdownIntegration:
                     for album_id in mock_artist_model.album_ids:
                         album_metadata = mock_album_metadata_generator(album_id)
                         album_callback(album_metadata)
-                        # Small delay to simulate real fetching
-                        await asyncio.sleep(0.01)
+                        # Yield to the loop as real fetching would
+                        await asyncio.sleep(0)
 
                 # Return initial artist metadata
                 return Mock(
@@ -152,23 +175,16 @@ class TestArtistCountdownIntegration:
             # Run the fetcher
             await fetcher._fetch_metadata()
 
-            # Verify progress emissions
-            assert len(progress_emissions) == 5  # One for each album
-
-            # Check countdown sequence
-            expected_remaining = [4, 3, 2, 1, 0]  # Countdown from 4 to 0
-            for i, (remaining, total, service) in enumerate(progress_emissions):
-                assert remaining == expected_remaining[i]
-                assert total == 5
-                assert service == "Qobuz"
+            # One emission per album, counting down from 4 to 0
+            assert progress_emissions == [(r, 5, "Qobuz") for r in range(4, -1, -1)]
 
-            # Verify all albums were processed
-            assert len(album_emissions) == 5
-            for i, album_metadata in enumerate(album_emissions):
+            # Verify all albums were processed in a single batch
+            assert len(album_batches) == 1
+            assert len(album_batches[0]) == 5
+            for i, album_metadata in enumerate(album_batches[0]):
                 expected_album_id = f"album_{i + 1}"
                 assert album_metadata["album_info"]["id"] == expected_album_id
 
-    @pytest.mark.asyncio
     async def test_metadata_service_integration(
         self,
         artist_parsed_url,
@@ -182,6 +198,7 @@ class TestArtistCountdownIntegration:
         # Track emissions
         metadata_emissions = []
         album_emissions = []
+        batch_emissions = []
         progress_emissions = []
 
         def track_metadata(metadata):
@@ -200,6 +217,7 @@ class TestArtistCountdownIntegration:
         # Connect signals
         service.metadata_ready.connect(track_metadata)
         service.album_ready.connect(track_album)
+        service.albums_ready.connect(batch_emissions.append)
         service.artist_progress_updated.connect(track_progress)
 
         # Mock the entire provider chain
@@ -208,29 +226,12 @@ class TestArtistCountdownIntegration:
         ) as mock_fetcher_class:
             # Create mock fetcher instance
             mock_fetcher = Mock()
-            mock_fetcher.metadata_fetched = Mock()
-            mock_fetcher.album_fetched = Mock()
-            mock_fetcher.artwork_fetched = Mock()
-            mock_fetcher.progress_updated = Mock()
-            mock_fetcher.artist_progress_updated = Mock()
-            mock_fetcher.error_occurred = Mock()
             mock_fetcher.start = Mock()
             mock_fetcher.isRunning = Mock(return_value=False)
 
             # Setup signal connections to actually work
-            class MockSignal:
-                def __init__(self):
-                    self.connected_slots = []
-
-                def connect(self, slot):
-                    self.connected_slots.append(slot)
-
-                def emit(self, *args):
-                    for slot in self.connected_slots:
-                        slot(*args)
-
             mock_fetcher.metadata_fetched = MockSignal()
-            mock_fetcher.album_fetched = MockSignal()
+            mock_fetcher.albums_fetched_batch = MockSignal()
             mock_fetcher.artist_progress_updated = MockSignal()
             mock_fetcher.artwork_fetched = MockSignal()
             mock_fetcher.progress_updated = MockSignal()
@@ -257,26 +258,24 @@ class TestArtistCountdownIntegration:
 
             # 2. Simulate album fetching with progress updates
             for i in range(5):
-                # Emit album
-                album_metadata = mock_album_metadata_generator(f"album_{i + 1}")
-                mock_fetcher.album_fetched.emit(album_metadata)
-
                 # Emit progress (remaining count decreases)
                 remaining = 4 - i
                 mock_fetcher.artist_progress_updated.emit(remaining, 5, "Qobuz")
 
+            # 3. Emit the fetched albums as one batch
+            mock_fetcher.albums_fetched_batch.emit([
+                mock_album_metadata_generator(f"album_{i + 1}") for i in range(5)
+            ])
+
             # Verify all signals were forwarded correctly
             assert len(metadata_emissions) == 1
             assert metadata_emissions[0]["content_type"] == "artist"
 
+            assert len(batch_emissions) == 1
             assert len(album_emissions) == 5
-            assert len(progress_emissions) == 5
 
-            # Verify countdown sequence
-            for i, (remaining, total, service) in enumerate(progress_emissions):
-                assert remaining == 4 - i  # 4, 3, 2, 1, 0
-                assert total == 5
-                assert service == "Qobuz"
+            # Verify countdown sequence: 4, 3, 2, 1, 0
+            assert progress_emissions == [(r, 5, "Qobuz") for r in range(4, -1, -1)]
 
     def test_thread_safety_under_concurrent_load(
         self, artist_parsed_url, mock_credentials
@@ -287,19 +286,19 @@ class TestArtistCountdownIntegration:
         # Initialize counter
         fetcher._initialize_artist_counter(100, "TestService")
 
-        # Create many threads that will decrement simultaneously
-        threads = []
-        for _ in range(100):
-            thread = threading.Thread(target=fetcher._decrement_remaining_items)
-            threads.append(thread)
+        # A few pooled workers released together each issue a burst of decrements
+        workers = 4
+        barrier = threading.Barrier(workers)
 
-        # Start all threads simultaneously
-        for thread in threads:
-            thread.start()
+        def decrement_burst():
+            barrier.wait()
+            for _ in range(100 // workers):
+                fetcher._decrement_remaining_items()
 
-        # Wait for all threads to complete
-        for thread in threads:
-            thread.join()
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(decrement_burst) for _ in range(workers)]
+        for future in futures:
+            future.result()
 
         # Verify final state - the key test is that we reach exactly 0
         # This proves the thread safety of the counter mechanism
@@ -343,15 +342,12 @@ class TestArtistCountdownIntegration:
         for _ in range(album_count):
             fetcher._decrement_remaining_items()
 
-        # Verify emissions
-        assert len(emissions) == expected_emissions
-
-        if expected_emissions > 0:
-            # Verify countdown sequence
-            for i, (remaining, total, service) in enumerate(emissions):
-                assert remaining == album_count - 1 - i
-                assert total == album_count
-                assert service == "TestService"
+        # Verify emissions count down from album_count - 1 to 0
+        expected = [
+            (album_count - 1 - i, album_count, "TestService")
+            for i in range(expected_emissions)
+        ]
+        assert emissions == expected
 
         # Verify final state
         assert fetcher._remaining_items == 0
@@ -397,13 +393,8 @@ class TestArtistCountdownIntegration:
                 "items": [],
             }
 
-            # Mock async task creation
-            with patch("asyncio.create_task") as mock_create_task:
-                mock_task = Mock()
-                mock_create_task.return_value = mock_task
-
-                # Call _on_album_fetched
-                fetcher._on_album_fetched(album_metadata)
+            # Call _on_album_fetched
+            fetcher._on_album_fetched(album_metadata)
 
             # Verify behavior based on content type
             if should_decrement:
@@ -5,6 +5,8 @@
 
 from __future__ import annotations
 
+from unittest.mock import patch
+
 import pytest
 
 from ripstream.ui.discography.view import DiscographyView
@@ -82,10 +84,38 @@ def test_progressive_sort_is_maintained(sample_album_metadata: dict) -> None:
 
     # After progressive add, list view should be sorted by title asc
     if view.list_view.rowCount() >= 2:
-        first_item = view.list_view.item(0, 0)
-        second_item = view.list_view.item(1, 0)
+        first_item = view.list_view.model().index(0, 0)
+        second_item = view.list_view.model().index(1, 0)
         assert first_item is not None
         assert second_item is not None
-        first = first_item.text()
-        second = second_item.text()
+        first = first_item.data()
+        second = second_item.data()
         assert first <= second
+
+
+@pytest.mark.usefixtures("qapp")
+def test_lightweight_album_skips_list_resort_and_filter(
+    sample_album_metadata: dict,
+) -> None:
+    """A lightweight emission adds no rows, so the list view is left alone."""
+    view = DiscographyView()
+    view.sort_items("title")
+
+    with (
+        patch.object(view.list_view, "sort_items") as list_sort,
+        patch.object(view.list_view, "set_filter") as list_filter,
+    ):
+        lightweight = sample_album_metadata.copy()
+        lightweight["items"] = []
+        view.set_content(lightweight)
+
+        assert len(view.grid_view.items) == 1
+        list_sort.assert_not_called()
+        list_filter.assert_not_called()
+
+        # The full album adds rows in sorted position and re-applies the filter
+        view.add_album_content(
+            sample_album_metadata["album_info"], sample_album_metadata["items"], "Qobuz"
+        )
+        list_sort.assert_not_called()
+        list_filter.assert_called_once_with("")
@@ -5,6 +5,8 @@
 
 from __future__ import annotations
 
+from unittest.mock import patch
+
 import pytest
 
 from ripstream.ui.discography.view import DiscographyView
@@ -47,3 +49,45 @@ class TestDiscographyViewActiveStatuses:
         # Active status updates should not override downloaded
         view.update_active_album_statuses({sample_album_item_with_source["id"]}, set())
         assert widget.get_status() == "downloaded"
+
+    def test_only_active_tiles_are_touched(
+        self, view: DiscographyView, sample_album_item
+    ):
+        # Add one album that becomes active and one that never does
+        view.grid_view.add_item(sample_album_item)
+        view.grid_view.add_item(sample_album_item | {"id": "idle_album"})
+        active, bystander = view.grid_view.items
+
+        with patch.object(bystander, "get_status") as bystander_status:
+            view.update_active_album_statuses({sample_album_item["id"]}, set())
+            view.update_active_album_statuses(set(), set())
+
+        bystander_status.assert_not_called()
+        # The album that left the active sets is still reverted to idle
+        assert active.get_status() == "idle"
+
+    def test_clicked_tile_never_queued_returns_to_idle(
+        self, view: DiscographyView, sample_album_item
+    ):
+        # A click marks the tile queued before the id reaches any tracked set
+        view.grid_view.add_item(sample_album_item)
+        widget = view.grid_view.items[0]
+        widget.download_btn.click()
+        assert widget.get_status() == "queued"
+
+        # The request never reached the queue, so the next update resets it
+        view.update_active_album_statuses(set(), set())
+        assert widget.get_status() == "idle"
+
+    def test_duplicate_tiles_share_statuses(
+        self, view: DiscographyView, sample_album_item
+    ):
+        view.grid_view.add_item(sample_album_item)
+        view.grid_view.add_item(sample_album_item)
+        first, second = view.grid_view.items
+
+        view.update_active_album_statuses({sample_album_item["id"]}, set())
+        assert first.get_status() == second.get_status() == "downloading"
+
+        view.update_active_album_statuses(set(), set())
+        assert first.get_status() == second.get_status() == "idle"
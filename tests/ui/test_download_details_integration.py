@@ -5,42 +5,37 @@
 
 from __future__ import annotations
 
-import contextlib
-import os
-from pathlib import Path
-from tempfile import NamedTemporaryFile
 from typing import TYPE_CHECKING
 from uuid import uuid4
 
 import pytest
 
 from ripstream.config.user import UserConfig
-from ripstream.models.db_manager import DatabaseManager
+from ripstream.models import db_manager as db_manager_module
+from ripstream.models.database import Base
 from ripstream.models.download_service import DownloadService
 from ripstream.models.enums import MediaType, StreamingSource
 
 if TYPE_CHECKING:
     from collections.abc import Iterator
 
+    from ripstream.models.db_manager import DatabaseManager
+
 
 @pytest.fixture
-def service() -> Iterator[DownloadService]:
-    with NamedTemporaryFile(suffix=".db", delete=False) as f:
-        temp_db = f.name
-    try:
-        cfg = UserConfig()
-        cfg.database.database_path = Path(temp_db)
-        dbm = DatabaseManager(temp_db)
-        dbm.initialize()
-        svc = DownloadService(cfg)
-        svc.downloads_db = dbm
-        svc.failed_downloads_repository = svc.failed_downloads_repository.__class__(dbm)
-        yield svc
-    finally:
-        with contextlib.suppress(Exception):
-            svc.downloads_db.close()
-        with contextlib.suppress(OSError):
-            os.unlink(temp_db)
+def service(
+    shared_dbm: DatabaseManager, monkeypatch: pytest.MonkeyPatch
+) -> Iterator[DownloadService]:
+    monkeypatch.setattr(db_manager_module, "_downloads_db", shared_dbm)
+    cfg = UserConfig()
+    cfg.database.database_path = shared_dbm.database_path
+    yield DownloadService(cfg)
+
+    # Empty every table so the shared database is clean for the next test
+    with shared_dbm.get_session() as session:
+        for table in reversed(Base.metadata.sorted_tables):
+            session.execute(table.delete())
+        session.commit()
 
 
 def test_get_download_details_after_add(service: DownloadService) -> None:
@@ -309,7 +309,7 @@ class TestDownloadsHistoryView:
         assert status_item is not None
         assert status_item.text() == "failed"
 
-    def test_remove_download(self, downloads_view, sample_download_item, qtbot):
+    def test_remove_download(self, downloads_view, sample_download_item):
         """Test removing a download."""
         # Ensure table is empty
         downloads_view.downloads_table.clear_all_downloads()
@@ -321,7 +321,7 @@ class TestDownloadsHistoryView:
         downloads_view.remove_download_item(sample_download_item["download_id"])
         assert downloads_view.downloads_table.rowCount() == 0
 
-    def test_retry_download(self, downloads_view, sample_download_item, qtbot):
+    def test_retry_download(self, downloads_view, sample_download_item):
         """Test retrying a download."""
         # Ensure table is empty
         downloads_view.downloads_table.clear_all_downloads()
@@ -334,7 +334,7 @@ class TestDownloadsHistoryView:
         # Check that retry signal was emitted
         # Note: We can't easily test signal emission without more complex setup
 
-    def test_clear_all_downloads(self, downloads_view, qtbot):
+    def test_clear_all_downloads(self, downloads_view):
         """Test clearing all downloads."""
         # Ensure table is empty first
         downloads_view.downloads_table.clear_all_downloads()
@@ -302,7 +302,7 @@ class TestMainPanel:
         assert main_panel.stacked_widget.widget(1) == new_downloads
         assert main_panel.stacked_widget.count() == 2
 
-    def test_content_signal_emission(self, main_panel, qtbot):
+    def test_content_signal_emission(self, main_panel):
         """Test content_requested signal emission."""
         # The signal is defined but not used in the current implementation
         # This test ensures the signal exists and can be connected
@@ -82,6 +82,7 @@ class TestMainWindowArtistProgress:
             window
         )
         window.handle_metadata_ready = MainWindow.handle_metadata_ready.__get__(window)
+        window.handle_albums_ready = MainWindow.handle_albums_ready.__get__(window)
 
         return window
 
@@ -254,6 +255,30 @@ class TestMainWindowArtistProgress:
         # Verify the status was updated with the expected message
         ui_manager.update_status.assert_called_with(expected_message)
 
+    def test_handle_albums_ready_skips_failing_album(
+        self, main_window, mock_main_window_dependencies
+    ):
+        """One failing album does not drop the rest of its batch."""
+        ui_manager = mock_main_window_dependencies["ui_manager"]
+        discography_view = ui_manager.get_discography_view.return_value
+        albums = [
+            {"album_info": {"id": f"album_{i}", "title": f"Album {i}"}}
+            for i in range(3)
+        ]
+        discography_view.add_album_progressively.side_effect = [
+            None,
+            RuntimeError("bad album"),
+            None,
+        ]
+
+        main_window.handle_albums_ready(albums)
+
+        assert [
+            call.args[0] for call in discography_view.add_album_progressively.mock_calls
+        ] == albums
+        ui_manager.update_status.assert_called_once_with("Loaded album: Album 2")
+        main_window._save_working_session.assert_called_once_with()
+
     def test_artist_progress_integration_with_metadata_service(
         self, main_window, mock_main_window_dependencies
     ):
@@ -272,7 +272,7 @@ class TestMetadataFetcherArtistCountdown:
         # Mock signals
         album_signal_mock = Mock()
         progress_signal_mock = Mock()
-        metadata_fetcher_artist.album_fetched = album_signal_mock
+        metadata_fetcher_artist.albums_fetched_batch = album_signal_mock
         metadata_fetcher_artist.artist_progress_updated = progress_signal_mock
 
         # Mock async task creation and artwork method
@@ -290,11 +290,13 @@ class TestMetadataFetcherArtistCountdown:
             mock_loop.create_task.return_value = mock_task
             mock_get_loop.return_value = mock_loop
 
-            # Call _on_album_fetched
+            # Call _on_album_fetched, then flush the buffered batch
             metadata_fetcher_artist._on_album_fetched(sample_album_metadata)
+            mock_loop.call_later.assert_called_once()
+            metadata_fetcher_artist._flush_album_buffer()
 
-        # Check that album_fetched signal was emitted
-        album_signal_mock.emit.assert_called_once_with(sample_album_metadata)
+        # Check that the album was emitted as a one-album batch
+        album_signal_mock.emit.assert_called_once_with([sample_album_metadata])
 
         # Check that counter was decremented and progress signal emitted
         assert metadata_fetcher_artist._remaining_items == 2
@@ -313,7 +315,7 @@ class TestMetadataFetcherArtistCountdown:
         # Mock signals
         album_signal_mock = Mock()
         progress_signal_mock = Mock()
-        metadata_fetcher_album.album_fetched = album_signal_mock
+        metadata_fetcher_album.albums_fetched_batch = album_signal_mock
         metadata_fetcher_album.artist_progress_updated = progress_signal_mock
 
         # Mock async task creation and artwork method
@@ -331,11 +333,13 @@ class TestMetadataFetcherArtistCountdown:
             mock_loop.create_task.return_value = mock_task
             mock_get_loop.return_value = mock_loop
 
-            # Call _on_album_fetched
+            # Call _on_album_fetched, then flush the buffered batch
             metadata_fetcher_album._on_album_fetched(sample_album_metadata)
+            mock_loop.call_later.assert_called_once()
+            metadata_fetcher_album._flush_album_buffer()
 
-        # Check that album_fetched signal was emitted
-        album_signal_mock.emit.assert_called_once_with(sample_album_metadata)
+        # Check that the album was emitted as a one-album batch
+        album_signal_mock.emit.assert_called_once_with([sample_album_metadata])
 
         # Check that counter was NOT decremented
         assert metadata_fetcher_album._remaining_items == 3  # Should remain unchanged
@@ -374,7 +378,7 @@ class TestMetadataFetcherArtistCountdown:
         # Mock signals
         album_signal_mock = Mock()
         progress_signal_mock = Mock()
-        fetcher.album_fetched = album_signal_mock
+        fetcher.albums_fetched_batch = album_signal_mock
         fetcher.artist_progress_updated = progress_signal_mock
 
         # Mock async task creation and artwork method
@@ -388,11 +392,13 @@ class TestMetadataFetcherArtistCountdown:
             mock_loop.create_task.return_value = mock_task
             mock_get_loop.return_value = mock_loop
 
-            # Call _on_album_fetched
+            # Call _on_album_fetched, then flush the buffered batch
             fetcher._on_album_fetched(sample_album_metadata)
+            mock_loop.call_later.assert_called_once()
+            fetcher._flush_album_buffer()
 
-        # Check album signal emission (should always happen)
-        album_signal_mock.emit.assert_called_once_with(sample_album_metadata)
+        # Check album batch emission (should always happen)
+        album_signal_mock.emit.assert_called_once_with([sample_album_metadata])
 
         # Check counter behavior based on content type
         if should_decrement:
@@ -403,7 +403,7 @@ class TestMetadataService:
         # but should not raise an exception
         assert credentials is None or isinstance(credentials, dict)
 
-    def test_fetcher_signal_emission(self, metadata_service, sample_parsed_url, qtbot):
+    def test_fetcher_signal_emission(self, metadata_service, sample_parsed_url):
         """Test that service properly forwards fetcher signals."""
         with patch(
             "ripstream.ui.metadata_service.MetadataFetcher"
@@ -434,6 +434,21 @@ class TestMetadataService:
             assert error_connect_call.__name__ == "emit"
             assert error_connect_call.__self__ == metadata_service.error_occurred
 
+    @pytest.mark.parametrize("per_album_listener", [False, True])
+    def test_albums_batch_forwarding(self, metadata_service, per_album_listener):
+        """Test that album batches are split only for per-album listeners."""
+        albums = [{"id": "album_1"}, {"id": "album_2"}]
+        batches = []
+        singles = []
+        metadata_service.albums_ready.connect(batches.append)
+        if per_album_listener:
+            metadata_service.album_ready.connect(singles.append)
+
+        metadata_service._on_albums_fetched(albums)
+
+        assert batches == [albums]
+        assert singles == (albums if per_album_listener else [])
+
     def test_cleanup_on_destruction(self, metadata_service):
         """Test cleanup when service is destroyed."""
         mock_fetcher = Mock()
@@ -43,7 +43,7 @@ class TestMetadataServiceArtistProgress:
         """Create mock MetadataFetcher."""
         fetcher = Mock()
         fetcher.metadata_fetched = Mock()
-        fetcher.album_fetched = Mock()
+        fetcher.albums_fetched_batch = Mock()
         fetcher.artwork_fetched = Mock()
         fetcher.progress_updated = Mock()
         fetcher.artist_progress_updated = Mock()
@@ -75,7 +75,7 @@ class TestMetadataServiceArtistProgress:
 
             # Verify all signals are connected
             mock_metadata_fetcher.metadata_fetched.connect.assert_called_once()
-            mock_metadata_fetcher.album_fetched.connect.assert_called_once()
+            mock_metadata_fetcher.albums_fetched_batch.connect.assert_called_once()
             mock_metadata_fetcher.artwork_fetched.connect.assert_called_once()
             mock_metadata_fetcher.progress_updated.connect.assert_called_once()
             mock_metadata_fetcher.artist_progress_updated.connect.assert_called_once()
@@ -152,7 +152,7 @@ class TestMetadataServiceArtistProgress:
         mock_fetcher1.terminate = Mock()
         mock_fetcher1.wait = Mock()
         mock_fetcher1.metadata_fetched = Mock()
-        mock_fetcher1.album_fetched = Mock()
+        mock_fetcher1.albums_fetched_batch = Mock()
         mock_fetcher1.artwork_fetched = Mock()
         mock_fetcher1.progress_updated = Mock()
         mock_fetcher1.artist_progress_updated = Mock()
@@ -163,7 +163,7 @@ class TestMetadataServiceArtistProgress:
         mock_fetcher2 = Mock()
         mock_fetcher2.isRunning.return_value = False
         mock_fetcher2.metadata_fetched = Mock()
-        mock_fetcher2.album_fetched = Mock()
+        mock_fetcher2.albums_fetched_batch = Mock()
         mock_fetcher2.artwork_fetched = Mock()
         mock_fetcher2.progress_updated = Mock()
         mock_fetcher2.artist_progress_updated = Mock()
@@ -199,7 +199,7 @@ class TestMetadataServiceArtistProgress:
             connection_order.append("metadata_fetched")
 
         def track_album_connect(slot):
-            connection_order.append("album_fetched")
+            connection_order.append("albums_fetched_batch")
 
         def track_artwork_connect(slot):
             connection_order.append("artwork_fetched")
@@ -216,7 +216,9 @@ class TestMetadataServiceArtistProgress:
         mock_metadata_fetcher.metadata_fetched.connect.side_effect = (
             track_metadata_connect
         )
-        mock_metadata_fetcher.album_fetched.connect.side_effect = track_album_connect
+        mock_metadata_fetcher.albums_fetched_batch.connect.side_effect = (
+            track_album_connect
+        )
         mock_metadata_fetcher.artwork_fetched.connect.side_effect = (
             track_artwork_connect
         )
@@ -237,7 +239,7 @@ class TestMetadataServiceArtistProgress:
         # Verify connection order
         expected_order = [
             "metadata_fetched",
-            "album_fetched",
+            "albums_fetched_batch",
             "artwork_fetched",
             "progress_updated",
             "artist_progress_updated",
@@ -282,7 +284,7 @@ class TestMetadataServiceArtistProgress:
         # Create a fetcher that will emit progress signals
         mock_fetcher = Mock()
         mock_fetcher.metadata_fetched = Mock()
-        mock_fetcher.album_fetched = Mock()
+        mock_fetcher.albums_fetched_batch = Mock()
         mock_fetcher.artwork_fetched = Mock()
         mock_fetcher.progress_updated = Mock()
         mock_fetcher.error_occurred = Mock()